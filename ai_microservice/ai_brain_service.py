@@ -255,6 +255,7 @@ def get_performance_analytics():
         # Read RL history for analytics
         history = []
         log_file = "logs/rl_state_summary.json"
+        ai_brain.flush()  # write out pending log lines so the history includes the latest feedback
         
         if os.path.exists(log_file):
             with open(log_file, 'r') as f:
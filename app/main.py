@@ -168,6 +168,25 @@ def health():
         db_manager.log_system_event("ERROR", "health_check_failed", str(e))
         raise HTTPException(status_code=500, detail=f"System health check failed: {str(e)}")
 
+@app.get("/dashboard/bootstrap")
+def dashboard_bootstrap():
+    """Batch the dashboards' startup reads into a single round-trip"""
+    def section(fetch):
+        try:
+            return fetch()
+        except Exception as e:
+            logger.warning(f"Dashboard bootstrap section failed: {e}")
+            return None
+    
+    return {
+        "health": section(health),
+        "ai_status": section(ai_brain.get_ai_status) if AI_BRAIN_AVAILABLE else None,
+        "candidates": section(candidate.list_candidates),
+        "feedback": section(feedback.get_feedback_logs),
+        "analytics": section(analytics.get_dashboard_metrics),
+        "timestamp": datetime.now().isoformat()
+    }
+
 @app.get("/system/status")
 def system_status():
     """Get detailed system status and diagnostics"""
@@ -201,9 +220,8 @@ def add_candidate(candidate: CandidateCreate, request: Request):
         # Calculate AI match score (enhanced with RL if available)
         if AI_BRAIN_AVAILABLE:
             try:
-                from hr_intelligence_brain import HRIntelligenceBrain
-                rl_brain = HRIntelligenceBrain()
-                candidate_dict["match_score"] = rl_brain.predict_success(candidate_dict) * 100
+                # Score with the router's shared brain: it already holds the live weights
+                candidate_dict["match_score"] = ai_brain.hr_brain.predict_success(candidate_dict) * 100
                 logger.info(f"RL-enhanced match score calculated: {candidate_dict['match_score']:.2f}")
             except Exception as e:
                 logger.warning(f"RL scoring failed, using fallback: {e}")
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header, Response
 from pydantic import BaseModel
 from typing import Dict, List, Any, Optional
 from hr_intelligence_brain import HRIntelligenceBrain
@@ -60,6 +60,9 @@ class FeedbackRequest(BaseModel):
             }
         }
 
+class FeedbackBatchRequest(BaseModel):
+    items: List[FeedbackRequest]
+
 class RLStateSummary(BaseModel):
     weights: Dict[str, float]
     learning_rate: float
@@ -161,19 +164,17 @@ def process_feedback(request: FeedbackRequest):
     This connects the loop: Decision -> Feedback -> Reward -> Policy Update.
     """
     try:
-        # Get prediction before learning for comparison
-        old_prediction = hr_brain.predict_success(request.candidate_data)
         old_weights_count = len(hr_brain.weights)
         
-        # Apply RL learning (this is where the magic happens)
-        hr_brain.reward_log(
+        # Apply RL learning (this is where the magic happens);
+        # reward_log scores the candidate before and after the update
+        learning = hr_brain.reward_log(
             request.candidate_data, 
             request.feedback_score, 
             request.outcome
         )
-        
-        # Get prediction after learning to measure impact
-        new_prediction = hr_brain.predict_success(request.candidate_data)
+        old_prediction = learning["prediction_before"]
+        new_prediction = learning["prediction_after"]
         new_weights_count = len(hr_brain.weights)
         
         # Calculate learning metrics
@@ -204,15 +205,60 @@ def process_feedback(request: FeedbackRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"RL Feedback processing failed: {str(e)}")
 
+@router.post("/feedback/bulk")
+def process_feedback_bulk(request: FeedbackBatchRequest):
+    """
+    ACTIVE RL: Apply several feedback items in one request, in order.
+    Same policy update as /feedback per item, without a round-trip each.
+    """
+    try:
+        old_weights_count = len(hr_brain.weights)
+        results = []
+        for item in request.items:
+            learning = hr_brain.reward_log(item.candidate_data, item.feedback_score, item.outcome)
+            results.append({
+                "prediction_before": learning["prediction_before"],
+                "prediction_after": learning["prediction_after"],
+                "learning_delta": learning["prediction_after"] - learning["prediction_before"],
+                "feedback_score": item.feedback_score,
+                "outcome": item.outcome
+            })
+        
+        return {
+            "status": "processed_active_learning",
+            "processed": len(results),
+            "results": results,
+            "weights_before": old_weights_count,
+            "weights_after": len(hr_brain.weights),
+            "rl_status": "ACTIVELY_LEARNING",
+            "new_weights_version": datetime.now().isoformat()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"RL bulk feedback processing failed: {str(e)}")
+
+# Distinguishes this process's weight versions from those of an earlier run
+_ETAG_EPOCH = f"{os.getpid():x}.{int(datetime.now().timestamp()):x}"
+
+def _weights_etag() -> str:
+    """Weak validator for /rl-state: the in-memory weights version, bumped on every update"""
+    return f'W/"{_ETAG_EPOCH}-{hr_brain._weights_version:x}"'
+
 @router.get("/rl-state")
-def get_rl_state():
+def get_rl_state(response: Response, if_none_match: Optional[str] = Header(None)):
     """
     Get the current internal state of the ACTIVE RL agent (weights, etc.)
     Used for the Dashboard visualization.
+    Supports If-None-Match: unchanged weights answer 304 without a body.
     """
     try:
-        # Reload weights to ensure freshness
-        current_weights = hr_brain._load_weights()
+        # The state is derived from the live weights, so their version validates it
+        etag = _weights_etag()
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        
+        # Serve the live policy; the file on disk lags by up to one flush interval
+        current_weights = dict(hr_brain.weights)
         
         # Calculate weight statistics
         if current_weights:
@@ -290,6 +336,7 @@ def get_rl_analytics():
         # Load history for analytics
         history = []
         log_file = "logs/rl_state_summary.json"
+        hr_brain.flush()  # write out pending log lines so the history includes the latest feedback
         
         if os.path.exists(log_file):
             with open(log_file, 'r') as f:
@@ -341,6 +388,7 @@ def get_rl_performance():
         # Load history for performance calculation
         history = []
         log_file = "logs/rl_state_summary.json"
+        hr_brain.flush()  # write out pending log lines so the history includes the latest feedback
         
         if os.path.exists(log_file):
             with open(log_file, 'r') as f:
@@ -382,6 +430,7 @@ def get_rl_history(limit: int = 100):
     try:
         history = []
         log_file = "logs/rl_state_summary.json"
+        hr_brain.flush()  # write out pending log lines so the history includes the latest feedback
         
         if os.path.exists(log_file):
             with open(log_file, 'r') as f:
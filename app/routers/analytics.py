@@ -3,12 +3,19 @@ from app.utils.helpers import load_json
 from app.utils.database import db_manager
 from app.utils.ai_engine import AIEngine
 from app.utils.ml_models import MLModels, PredictiveAnalytics
+from app.routers.feedback import get_feedback_logs
+from collections import Counter
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+def _outcome_counts(feedback_logs):
+    """Outcome -> count; CSV rows carry the outcome directly, timeline entries under details"""
+    outcomes = (log.get("outcome") or (log.get("details") or {}).get("outcome") for log in feedback_logs)
+    return dict(Counter(outcome for outcome in outcomes if outcome))
+
 @router.get("/dashboard")
 def get_dashboard_metrics():
     """Get comprehensive dashboard metrics"""
@@ -21,7 +28,9 @@ def get_dashboard_metrics():
             "total_feedback": len(feedback_logs) if isinstance(feedback_logs, list) else 0,
             "avg_match_score": 0,
             "top_skills": [],
-            "recent_activity": 0
+            "recent_activity": 0,
+            # Counted from the same feedback logs /feedback/logs serves, so the pie matches the feedback totals
+            "outcome_counts": _outcome_counts(get_feedback_logs())
         }
         
         if isinstance(candidates, list) and candidates:
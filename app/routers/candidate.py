@@ -3,6 +3,8 @@ from app.models import CandidateCreate
 from app.utils.helpers import load_json, save_json
 from app.utils.database import db_manager
 from datetime import datetime
+from collections import Counter
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -47,10 +49,42 @@ def add_candidate(candidate: CandidateCreate, request: Request):
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/list")
-def list_candidates():
-    """List all candidates"""
+def list_candidates(limit: Optional[int] = None, offset: int = 0, search: str = "",
+                    min_score: float = 0, skill: Optional[str] = None):
+    """List all candidates, or a filtered page of them when limit is given.
+    
+    Without limit the full list is returned unchanged. With limit the response is
+    {"items", "total", "skills"}, where skills is the catalog across all candidates.
+    """
     candidates = load_json("data/candidates.json")
-    return candidates if isinstance(candidates, list) else []
+    candidates = candidates if isinstance(candidates, list) else []
+    if limit is None:
+        return candidates
+    
+    skill_counts = Counter()
+    for c in candidates:
+        skill_counts.update(c.get("skills") or [])
+    
+    needle = search.strip().lower()
+    matches = []
+    for c in candidates:
+        skills = c.get("skills") or []
+        if (c.get("match_score") or 0) < min_score:
+            continue
+        if skill and skill not in skills:
+            continue
+        if needle:
+            haystack = " ".join([str(c.get("name", "")), str(c.get("email", "")), str(c.get("phone", ""))] + list(skills))
+            if needle not in haystack.lower():
+                continue
+        matches.append(c)
+    
+    offset = max(offset, 0)
+    return {
+        "items": matches[offset:offset + max(limit, 0)],
+        "total": len(matches),
+        "skills": [s for s, _ in skill_counts.most_common()]
+    }
 
 @router.get("/{candidate_id}")
 def get_candidate(candidate_id: int):
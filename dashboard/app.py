@@ -1,9 +1,13 @@
 import streamlit as st
+from streamlit_autorefresh import st_autorefresh
 import requests
+import orjson
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import time
 
@@ -52,6 +56,91 @@ st.markdown("""
 
 st.markdown('<div class="main-header"><h1>🚀 HR-AI System Dashboard v3.0</h1><p>AI-Powered Recruitment & Analytics Platform</p></div>', unsafe_allow_html=True)
 
+def _raw_api_request(method, endpoint, data=None, retries=2):
+    for attempt in range(retries):
+        try:
+            url = f"{API_BASE}{endpoint}"
+            if method == "GET":
+                response = requests.get(url, timeout=5)
+            elif method == "POST":
+                response = requests.post(url, json=data, timeout=5)
+            
+            if response.status_code == 200:
+                return (orjson.loads(response.content) if response.content else None), None
+            else:
+                return None, f"API Error: {response.status_code}"
+        except requests.exceptions.ConnectionError:
+            if attempt == retries - 1:
+                return None, "Backend offline. Please start the API server."
+            time.sleep(1)
+        except requests.exceptions.Timeout:
+            if attempt == retries - 1:
+                return None, "Request timeout. Server may be overloaded."
+            time.sleep(1)
+        except Exception as e:
+            return None, f"Error: {str(e)}"
+    return None, "Connection failed"
+
+class _ApiGetError(Exception):
+    """Raised inside the cached GET so failed responses are never memoized"""
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_get(endpoint):
+    data, error = _raw_api_request("GET", endpoint)
+    if error:
+        raise _ApiGetError(error)
+    return data
+
+def api_get(endpoint):
+    """Cached GET so widget-driven reruns don't re-hit the backend; errors are retried on the next call"""
+    try:
+        return _cached_get(endpoint), None
+    except _ApiGetError as e:
+        return None, str(e)
+
+def make_api_request(method, endpoint, data=None, retries=2):
+    if method == "GET":
+        return api_get(endpoint)
+    return _raw_api_request(method, endpoint, data, retries)
+
+def score_histogram(scores, title, nbins=20):
+    """Histogram pre-binned in NumPy and drawn as bars (skips plotly.express)"""
+    counts, edges = np.histogram(np.asarray(scores, dtype=np.float64), bins=nbins)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+    fig.update_layout(title=title)
+    return fig
+
+@st.cache_resource
+def _background_pool():
+    return ThreadPoolExecutor(max_workers=2)
+
+def rl_status_async():
+    """Last known /ai/status, refreshed off the render thread.
+    
+    Returns (status, checked): checked is False until the first background probe completes.
+    """
+    future = st.session_state.get("rl_status_future")
+    if future is not None and future.done():
+        st.session_state.rl_status, _ = future.result()
+        st.session_state.rl_status_checked = True
+        future = None
+    if future is None:
+        st.session_state.rl_status_future = _background_pool().submit(_raw_api_request, "GET", "/ai/status")
+    return st.session_state.get("rl_status"), st.session_state.get("rl_status_checked", False)
+
+@st.fragment(run_every="2s")
+def rl_status_banner():
+    """RL status line; the fragment reruns on its own so a finished probe shows up without a page rerun"""
+    rl_status, rl_checked = rl_status_async()
+    if not rl_checked:
+        st.info("⏳ Checking RL Brain status…")
+    elif rl_status and rl_status.get("rl_status") == "ACTIVE":
+        st.success("✅ RL Brain is FULLY ACTIVE and learning!")
+    elif rl_status:
+        st.warning("⚠️ RL Brain status unclear")
+    else:
+        st.error("❌ Cannot connect to RL Brain")
+
 # Enhanced Sidebar
 with st.sidebar:
     st.markdown("### 🏠 Navigation")
@@ -59,32 +148,11 @@ with st.sidebar:
     # Real-time system status
     status_placeholder = st.empty()
     
-    def make_api_request(method, endpoint, data=None, retries=2):
-        for attempt in range(retries):
-            try:
-                url = f"{API_BASE}{endpoint}"
-                if method == "GET":
-                    response = requests.get(url, timeout=5)
-                elif method == "POST":
-                    response = requests.post(url, json=data, timeout=5)
-                
-                if response.status_code == 200:
-                    return response.json(), None
-                else:
-                    return None, f"API Error: {response.status_code}"
-            except requests.exceptions.ConnectionError:
-                if attempt == retries - 1:
-                    return None, "Backend offline. Please start the API server."
-                time.sleep(1)
-            except requests.exceptions.Timeout:
-                if attempt == retries - 1:
-                    return None, "Request timeout. Server may be overloaded."
-                time.sleep(1)
-            except Exception as e:
-                return None, f"Error: {str(e)}"
-        return None, "Connection failed"
+    # One batched call for health, RL status and the quick stats
+    bootstrap, _ = make_api_request("GET", "/dashboard/bootstrap")
+    bootstrap = bootstrap or {}
     
-    health_data, _ = make_api_request("GET", "/health")
+    health_data = bootstrap.get("health")
     if health_data:
         status_placeholder.success("✅ System Online")
     else:
@@ -102,29 +170,25 @@ with st.sidebar:
     
     # Quick stats in sidebar
     st.markdown("### 📊 Quick Stats")
-    candidates_data, _ = make_api_request("GET", "/candidate/list")
+    candidates_data = bootstrap.get("candidates")
     if candidates_data:
         st.metric("👥 Candidates", len(candidates_data))
     
-    feedback_data, _ = make_api_request("GET", "/feedback/logs")
+    feedback_data = bootstrap.get("feedback")
     if feedback_data:
         st.metric("📝 Feedback", len(feedback_data))
     
     # RL Status in sidebar
     st.markdown("---")
     st.markdown("### 🧠 RL Brain Status")
-    try:
-        rl_status_response = requests.get(f"{API_BASE}/ai/status")
-        if rl_status_response.status_code == 200:
-            rl_status = rl_status_response.json()
-            if rl_status.get("rl_status") == "ACTIVE":
-                st.success("🟢 RL Active")
-                st.metric("Skills Learned", rl_status.get("brain_metrics", {}).get("total_skills", 0))
-            else:
-                st.warning("🟡 RL Inactive")
+    rl_status = bootstrap.get("ai_status")
+    if rl_status:
+        if rl_status.get("rl_status") == "ACTIVE":
+            st.success("🟢 RL Active")
+            st.metric("Skills Learned", rl_status.get("brain_metrics", {}).get("total_skills", 0))
         else:
-            st.error("🔴 RL Offline")
-    except:
+            st.warning("🟡 RL Inactive")
+    else:
         st.error("🔴 RL Offline")
     
     # Auto-refresh toggle
@@ -132,8 +196,7 @@ with st.sidebar:
     auto_refresh = st.checkbox("🔄 Auto Refresh (30s)")
     
     if auto_refresh:
-        time.sleep(30)
-        st.rerun()
+        st_autorefresh(interval=30_000, limit=None, key="app_auto")
 
 if page == "Overview":
     st.header("System Overview")
@@ -141,7 +204,7 @@ if page == "Overview":
     col1, col2, col3 = st.columns(3)
     
     # Check system health
-    health_data, error = make_api_request("GET", "/health")
+    health_data = bootstrap.get("health")
     if health_data:
         with col1:
             st.metric("System Status", "Healthy", "🟢")
@@ -150,14 +213,13 @@ if page == "Overview":
         with col3:
             st.metric("API", "Active", "⚡")
     else:
-        st.error(f"System Health Check Failed: {error}")
+        st.error("System Health Check Failed: backend unreachable")
     
     # Show recent feedback
-    feedback_data, error = make_api_request("GET", "/feedback/logs")
+    feedback_data = bootstrap.get("feedback")
     if feedback_data and len(feedback_data) > 0:
         st.subheader("Recent Feedback")
-        df = pd.DataFrame(feedback_data)
-        st.dataframe(df.head(10))
+        st.dataframe(pd.DataFrame(feedback_data[:10]))
 
 elif page == "Candidates":
     st.header("Candidate Management")
@@ -185,6 +247,7 @@ elif page == "Candidates":
                     result, error = make_api_request("POST", "/candidate/add", candidate_data)
                     if result:
                         st.success(f"Candidate added successfully! ID: {result['candidate_id']}")
+                        st.cache_data.clear()
                         st.rerun()
                     else:
                         st.error(f"Failed to add candidate: {error}")
@@ -229,6 +292,7 @@ elif page == "Feedback":
                 result, error = make_api_request("POST", "/feedback/hr_feedback", feedback_data)
                 if result:
                     st.success("Feedback submitted successfully!")
+                    st.cache_data.clear()
                     st.rerun()
                 else:
                     st.error(f"Failed to submit feedback: {error}")
@@ -313,7 +377,8 @@ elif page == "Analytics":
         if candidates_data and len(candidates_data) > 0:
             df = pd.DataFrame(candidates_data)
             if 'match_score' in df.columns:
-                fig_dist = px.histogram(df, x='match_score', nbins=20, title="Candidate Score Distribution")
+                # Unscored candidates are left out rather than counted as 0
+                fig_dist = score_histogram(df['match_score'].dropna(), "Candidate Score Distribution")
                 st.plotly_chart(fig_dist, use_container_width=True)
             else:
                 st.info("No scores available yet")
@@ -321,7 +386,7 @@ elif page == "Analytics":
             st.info("No candidates data")
             # Fallback to sample if empty for demo
             scores = np.random.normal(75, 15, 100)
-            fig_dist = px.histogram(x=scores, nbins=20, title="Sample Score Distribution")
+            fig_dist = score_histogram(scores, "Sample Score Distribution")
             st.plotly_chart(fig_dist, use_container_width=True)
     
     with col2:
@@ -343,50 +408,40 @@ elif page == "Analytics":
     st.subheader("💬 Feedback Analytics")
     feedback_data, _ = make_api_request("GET", "/feedback/logs")
     if feedback_data and len(feedback_data) > 0:
-        df_feedback = pd.DataFrame(feedback_data)
-        
+        # Each chart needs a single field, so aggregate straight from the records
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if 'outcome' in df_feedback.columns:
-                outcome_counts = df_feedback['outcome'].value_counts()
-                fig_pie = px.pie(values=outcome_counts.values, names=outcome_counts.index, title="Outcome Distribution")
+            outcome_counts = Counter(row.get('outcome') for row in feedback_data if row.get('outcome'))
+            if outcome_counts:
+                fig_pie = px.pie(values=list(outcome_counts.values()), names=list(outcome_counts.keys()), title="Outcome Distribution")
                 st.plotly_chart(fig_pie, use_container_width=True)
         
         with col2:
-            if 'score' in df_feedback.columns:
-                avg_score = df_feedback['score'].astype(float).mean()
-                st.metric("Average Score", f"{avg_score:.2f}", "📊")
+            scores = [float(row['score']) for row in feedback_data if row.get('score') not in (None, "")]
+            if scores:
+                st.metric("Average Score", f"{np.mean(scores):.2f}", "📊")
                 
-                fig_score = px.box(df_feedback, y='score', title="Score Distribution")
+                fig_score = go.Figure(go.Box(y=scores, name="score"))
+                fig_score.update_layout(title="Score Distribution")
                 st.plotly_chart(fig_score, use_container_width=True)
         
         with col3:
-            total_feedback = len(df_feedback)
+            total_feedback = len(feedback_data)
             st.metric("Total Feedback", total_feedback, "📝")
             
-            if 'timestamp' in df_feedback.columns:
-                df_feedback['date'] = pd.to_datetime(df_feedback['timestamp']).dt.date
-                daily_counts = df_feedback.groupby('date').size()
-                fig_timeline = px.line(x=daily_counts.index, y=daily_counts.values, title="Daily Feedback Trend")
+            timestamps = [row['timestamp'] for row in feedback_data if row.get('timestamp')]
+            if timestamps:
+                daily_counts = sorted(Counter(pd.to_datetime(timestamps).date).items())
+                dates, counts = zip(*daily_counts)
+                fig_timeline = px.line(x=dates, y=counts, title="Daily Feedback Trend")
                 st.plotly_chart(fig_timeline, use_container_width=True)
 
 elif page == "RL Analytics":
     st.header("🧠 Reinforcement Learning Analytics")
     
-    # RL Status Check
-    try:
-        rl_status_response = requests.get(f"{API_BASE}/ai/status")
-        if rl_status_response.status_code == 200:
-            rl_status = rl_status_response.json()
-            if rl_status.get("rl_status") == "ACTIVE":
-                st.success("✅ RL Brain is FULLY ACTIVE and learning!")
-            else:
-                st.warning("⚠️ RL Brain status unclear")
-        else:
-            st.error("❌ Cannot connect to RL Brain")
-    except:
-        st.error("❌ RL Brain connection failed")
+    # RL Status Check (non-blocking; populated by a background probe)
+    rl_status_banner()
     
     # RL Performance Metrics
     st.subheader("📊 RL Performance Dashboard")
@@ -597,6 +652,7 @@ elif page == "RL Analytics":
     
     with col1:
         if st.button("🔄 Refresh RL Data", use_container_width=True):
+            st.cache_data.clear()
             st.rerun()
     
     with col2:
@@ -618,6 +674,7 @@ elif page == "RL Analytics":
                     reset_response = requests.post(f"{API_BASE}/ai/rl-reset?confirm=true")
                     if reset_response.status_code == 200:
                         st.success("RL weights reset successfully!")
+                        st.cache_data.clear()
                         st.rerun()
                     else:
                         st.error("Reset failed")
@@ -725,6 +782,7 @@ elif page == "Smart Features":
         if st.button("Update All Match Scores"):
             update_data, error = make_api_request("POST", "/smart/bulk-score-update")
             if update_data:
+                st.cache_data.clear()
                 updated_count = update_data.get('updated', 0)
                 st.success(f"✅ Updated {updated_count} candidates")
                 if updated_count > 0:
@@ -767,13 +825,12 @@ with st.sidebar:
         st.success("✅ AI Engine: Active")
         
         # Check RL status
-        try:
-            rl_check = requests.get(f"{API_BASE}/ai/status")
-            if rl_check.status_code == 200 and rl_check.json().get("rl_status") == "ACTIVE":
-                st.success("✅ RL Brain: ACTIVE")
-            else:
-                st.warning("⚠️ RL Brain: Inactive")
-        except:
+        rl_check = bootstrap.get("ai_status")
+        if rl_check and rl_check.get("rl_status") == "ACTIVE":
+            st.success("✅ RL Brain: ACTIVE")
+        elif rl_check:
+            st.warning("⚠️ RL Brain: Inactive")
+        else:
             st.error("❌ RL Brain: Offline")
     else:
         st.error("❌ Backend: Offline")
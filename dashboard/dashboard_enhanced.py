@@ -1,9 +1,16 @@
 import streamlit as st
+import streamlit.components.v1 as components
+from streamlit_autorefresh import st_autorefresh
 import requests
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import datetime
+from urllib.parse import urlencode
 import numpy as np
 
 st.set_page_config(
@@ -14,7 +21,7 @@ st.set_page_config(
 )
 
 # Enhanced CSS
-st.markdown("""
+CUSTOM_CSS = """
 <style>
 .main-header {
     background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -53,11 +60,14 @@ st.markdown("""
     text-align: center;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+# Streamlit drops elements a rerun doesn't re-emit, so the block is sent every run; collapse whitespace to keep it small
+st.markdown(" ".join(CUSTOM_CSS.split()), unsafe_allow_html=True)
 
 API_BASE = "http://localhost:5000"
+CANDIDATE_PAGE_SIZE = 50
 
-def make_api_request(method, endpoint, data=None):
+def _raw_api_request(method, endpoint, data=None):
     try:
         url = f"{API_BASE}{endpoint}"
         if method == "GET":
@@ -66,12 +76,158 @@ def make_api_request(method, endpoint, data=None):
             response = requests.post(url, json=data, timeout=10)
         
         if response.status_code == 200:
-            return response.json(), None
+            return (orjson.loads(response.content) if response.content else None), None
         else:
             return None, f"API Error: {response.status_code}"
     except Exception as e:
         return None, f"Connection Error: {str(e)}"
 
+class _ApiGetError(Exception):
+    """Raised inside the cached GET so failed responses are never memoized"""
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_get(endpoint):
+    data, error = _raw_api_request("GET", endpoint)
+    if error:
+        raise _ApiGetError(error)
+    return data
+
+def api_get(endpoint):
+    """Cached GET so widget-driven reruns don't re-hit the backend; errors are retried on the next call"""
+    try:
+        return _cached_get(endpoint), None
+    except _ApiGetError as e:
+        return None, str(e)
+
+def make_api_request(method, endpoint, data=None):
+    if method == "GET":
+        return api_get(endpoint)
+    return _raw_api_request(method, endpoint, data)
+
+def _candidates_frame(candidates_data):
+    """Arrow-backed candidates frame with skills as a list<string> column"""
+    table = pa.Table.from_pylist(candidates_data)
+    if 'skills' in table.column_names:
+        table = table.set_column(
+            table.schema.get_field_index('skills'), 'skills',
+            table['skills'].cast(pa.list_(pa.string()))
+        )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+def _figure_html(fig):
+    """Serialize a figure once into an embeddable HTML fragment"""
+    return pio.to_html(fig, include_plotlyjs="cdn", full_html=False, default_width="100%", config={"responsive": True})
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def _score_histogram(scores):
+    """Score distribution chart as cached HTML, binned server-side"""
+    counts, edges = np.histogram(np.asarray(scores, dtype=np.float32), bins=15)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color='#667eea'
+    ))
+    fig.update_layout(
+        title="Score Distribution",
+        height=350,
+        showlegend=False,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return _figure_html(fig)
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def _outcome_pie(outcome_items):
+    """Hiring outcomes pie as cached HTML from (outcome, count) pairs"""
+    names, values = zip(*outcome_items)
+    fig = px.pie(
+        values=values, 
+        names=names,
+        title="Hiring Outcomes",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig.update_layout(height=350)
+    return _figure_html(fig)
+
+@st.fragment
+def candidate_browser():
+    """Filter/search UI; reruns on its own so keystrokes don't rerun the whole page"""
+    # Empty page first: gives the skill catalog and total without transferring any rows
+    catalog, error = make_api_request("GET", "/candidate/list?limit=0")
+    if not catalog:
+        if error:
+            st.error(f"❌ {error}")
+        return
+    if catalog["total"] == 0:
+        st.info("No candidates yet. Add one above to get started.")
+        return
+    
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        search = st.text_input("🔍 Search candidates")
+    with col2:
+        min_score = st.slider("📊 Min Score", 0, 100, 0)
+    with col3:
+        skill_filter = st.selectbox("💼 Skill Filter", ["All"] + catalog["skills"])
+    
+    # Filtering and paging happen server-side; only one page of rows comes back
+    params = {"limit": CANDIDATE_PAGE_SIZE, "search": search, "min_score": min_score}
+    if skill_filter != "All":
+        params["skill"] = skill_filter
+    if st.session_state.get("candidate_filters") != (search, min_score, skill_filter):
+        st.session_state.candidate_filters = (search, min_score, skill_filter)
+        st.session_state.candidate_page = 1
+    page_no = st.session_state.get("candidate_page", 1)
+    
+    result, error = make_api_request("GET", f"/candidate/list?{urlencode({**params, 'offset': (page_no - 1) * CANDIDATE_PAGE_SIZE})}")
+    if not result:
+        st.error(f"❌ {error}")
+        return
+    total_pages = max(1, -(-result["total"] // CANDIDATE_PAGE_SIZE))
+    if page_no > total_pages:
+        st.session_state.candidate_page = page_no = total_pages
+        result, _ = make_api_request("GET", f"/candidate/list?{urlencode({**params, 'offset': (page_no - 1) * CANDIDATE_PAGE_SIZE})}")
+    
+    # Display results
+    st.markdown(f"### 📋 Results ({result['total']} candidates)")
+    if result["items"]:
+        df = _candidates_frame(result["items"])
+        # One table widget instead of a container/columns block per row
+        scores = df.get('match_score', pd.Series(0.0, index=df.index)).fillna(0)
+        if 'skills' in df.columns:
+            top_skills = pc.fill_null(pc.binary_join(pc.list_slice(pa.array(df['skills']), 0, 3), ", "), "").to_pylist()
+        else:
+            top_skills = ""
+        df = df.assign(
+            Score=scores.map(lambda s: f"{'🟢' if s >= 80 else '🟡' if s >= 60 else '🔴'} {s:.1f}%"),
+            Skills=top_skills
+        )
+        display_cols = [c for c in ["name", "email", "Skills", "phone", "Score"] if c in df.columns]
+        st.dataframe(
+            df[display_cols],
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "name": "👤 Name",
+                "email": "📧 Email",
+                "Skills": "💼 Skills",
+                "phone": "📱 Phone",
+                "Score": "📊 Score"
+            }
+        )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.number_input(f"📄 Page (of {total_pages})", min_value=1, max_value=total_pages, step=1, key="candidate_page")
+        with col2:
+            if 'id' in df.columns:
+                view_id = st.selectbox("👁️ View candidate", df['id'].tolist())
+                st.info(f"Candidate ID: {view_id}")
+    else:
+        st.info("🔍 No candidates match your filters")
+
 # Enhanced Header
 st.markdown('''
 <div class="main-header">
@@ -85,8 +241,12 @@ st.markdown('''
 with st.sidebar:
     st.markdown("### 🎛️ Control Center")
     
+    # One batched call for everything the sidebar and dashboard page need
+    bootstrap, _ = make_api_request("GET", "/dashboard/bootstrap")
+    bootstrap = bootstrap or {}
+    
     # Real-time status
-    health_data, _ = make_api_request("GET", "/health")
+    health_data = bootstrap.get("health")
     if health_data:
         st.markdown('<div class="success-card">🟢 System Online</div>', unsafe_allow_html=True)
         
@@ -121,17 +281,19 @@ with st.sidebar:
     # Quick actions
     st.markdown("### ⚡ Quick Actions")
     if st.button("🔄 Refresh Data"):
+        st.cache_data.clear()
         st.rerun()
     
     if st.button("📊 Update Scores"):
         update_data, _ = make_api_request("POST", "/smart/bulk-score-update")
         if update_data:
+            st.cache_data.clear()
             st.success(f"✅ Updated {update_data.get('updated', 0)} scores")
     
     # Auto-refresh
     auto_refresh = st.checkbox("🔄 Auto Refresh (30s)")
     if auto_refresh:
-        st.rerun()
+        st_autorefresh(interval=30_000, limit=None, key="dash_auto")
 
 # Main Content
 if page == "dashboard":
@@ -139,9 +301,9 @@ if page == "dashboard":
     col1, col2, col3, col4 = st.columns(4)
     
     # Get data
-    candidates_data, _ = make_api_request("GET", "/candidate/list")
-    feedback_data, _ = make_api_request("GET", "/feedback/logs")
-    analytics_data, _ = make_api_request("GET", "/analytics/dashboard")
+    candidates_data = bootstrap.get("candidates")
+    feedback_data = bootstrap.get("feedback")
+    analytics_data = bootstrap.get("analytics")
     
     # Enhanced metrics
     with col1:
@@ -193,35 +355,15 @@ if page == "dashboard":
     with col1:
         st.markdown("### 📈 Candidate Pipeline")
         if candidates_data:
-            scores = [c.get('match_score', 0) for c in candidates_data]
-            fig = px.histogram(
-                x=scores, 
-                nbins=15, 
-                title="Score Distribution",
-                color_discrete_sequence=['#667eea']
-            )
-            fig.update_layout(
-                height=350,
-                showlegend=False,
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            # Bin server-side so the browser only receives 15 bars, not N raw scores
+            scores = tuple(c.get('match_score') or 0 for c in candidates_data)
+            components.html(_score_histogram(scores), height=370)
     
     with col2:
         st.markdown("### 🎯 Success Metrics")
-        if feedback_data:
-            df = pd.DataFrame(feedback_data)
-            if 'outcome' in df.columns:
-                outcome_counts = df['outcome'].value_counts()
-                fig = px.pie(
-                    values=outcome_counts.values, 
-                    names=outcome_counts.index,
-                    title="Hiring Outcomes",
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                fig.update_layout(height=350)
-                st.plotly_chart(fig, use_container_width=True)
+        outcome_counts = analytics_data.get('outcome_counts', {}) if analytics_data else {}
+        if outcome_counts:
+            components.html(_outcome_pie(tuple(outcome_counts.items())), height=370)
 
 elif page == "candidates":
     st.markdown("## 👥 Candidate Management")
@@ -249,65 +391,13 @@ elif page == "candidates":
                     if result:
                         st.success(f"✅ Candidate added! ID: {result['candidate_id']}")
                         st.balloons()
+                        st.cache_data.clear()
                         st.rerun()
                     else:
                         st.error(f"❌ {error}")
     
     # Enhanced candidate list
-    candidates_data, error = make_api_request("GET", "/candidate/list")
-    if candidates_data:
-        # Filters
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            search = st.text_input("🔍 Search candidates")
-        with col2:
-            min_score = st.slider("📊 Min Score", 0, 100, 0)
-        with col3:
-            all_skills = list(set(skill for c in candidates_data for skill in c.get('skills', [])))
-            skill_filter = st.selectbox("💼 Skill Filter", ["All"] + all_skills)
-        
-        # Apply filters
-        df = pd.DataFrame(candidates_data)
-        if search:
-            mask = df.astype(str).apply(lambda x: x.str.contains(search, case=False, na=False)).any(axis=1)
-            df = df[mask]
-        
-        if 'match_score' in df.columns:
-            df = df[df['match_score'] >= min_score]
-        
-        if skill_filter != "All":
-            df = df[df['skills'].apply(lambda x: skill_filter in x if isinstance(x, list) else False)]
-        
-        # Display results
-        st.markdown(f"### 📋 Results ({len(df)} candidates)")
-        if len(df) > 0:
-            # Enhanced table display
-            for _, candidate in df.iterrows():
-                with st.container():
-                    col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
-                    
-                    with col1:
-                        st.markdown(f"**👤 {candidate.get('name', 'N/A')}**")
-                        st.markdown(f"📧 {candidate.get('email', 'N/A')}")
-                    
-                    with col2:
-                        skills = candidate.get('skills', [])
-                        if isinstance(skills, list):
-                            st.markdown(f"💼 {', '.join(skills[:3])}")
-                        st.markdown(f"📱 {candidate.get('phone', 'N/A')}")
-                    
-                    with col3:
-                        score = candidate.get('match_score', 0)
-                        color = "🟢" if score >= 80 else "🟡" if score >= 60 else "🔴"
-                        st.markdown(f"{color} **{score:.1f}%**")
-                    
-                    with col4:
-                        if st.button(f"👁️ View", key=f"view_{candidate.get('id')}"):
-                            st.info(f"Candidate ID: {candidate.get('id')}")
-                    
-                    st.markdown("---")
-        else:
-            st.info("🔍 No candidates match your filters")
+    candidate_browser()
 
 elif page == "ai_features":
     st.markdown("## 🤖 AI-Powered Features")
@@ -336,6 +426,7 @@ elif page == "ai_features":
                 update_data, error = make_api_request("POST", "/smart/bulk-score-update")
                 if update_data:
                     updated = update_data.get('updated', 0)
+                    st.cache_data.clear()
                     st.success(f"✅ Updated {updated} candidates")
                     if updated > 0:
                         st.balloons()
@@ -1,7 +1,9 @@
 import streamlit as st
+from functools import lru_cache
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 from datetime import datetime
 
 def create_metric_card(title, value, delta=None, icon="📊"):
@@ -20,7 +22,12 @@ def create_status_indicator(status, label):
 def create_progress_ring(value, max_value, label):
     """Create circular progress indicator"""
     percentage = (value / max_value) * 100 if max_value > 0 else 0
-    
+    # Snap to whole percents so nearby values share one cached spec; each caller gets its own figure
+    return go.Figure(_progress_ring(round(percentage), label))
+
+@lru_cache(maxsize=256)
+def _progress_ring(percentage, label):
+    """Figure spec as a plain dict; callers build a fresh go.Figure from it"""
     fig = go.Figure(go.Indicator(
         mode = "gauge+number+delta",
         value = percentage,
@@ -39,7 +46,7 @@ def create_progress_ring(value, max_value, label):
                 'value': 90}}))
     
     fig.update_layout(height=200, margin=dict(l=20, r=20, t=40, b=20))
-    return fig
+    return fig.to_dict()
 
 def create_timeline_chart(data):
     """Create interactive timeline chart"""
@@ -82,7 +89,9 @@ def create_data_table(data, title="Data Table"):
     # Add search functionality
     search_term = st.text_input(f"🔍 Search {title}")
     if search_term:
-        mask = df.astype(str).apply(lambda x: x.str.contains(search_term, case=False, na=False)).any(axis=1)
+        mask = np.zeros(len(df), dtype=bool)
+        for col in df.columns:  # numeric and string-dtype columns are searchable too
+            mask |= df[col].astype(str).str.contains(search_term, case=False, na=False, regex=False).to_numpy()
         df = df[mask]
     
     # Display table with styling
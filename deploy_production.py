@@ -4,12 +4,73 @@ Production Deployment Script for HR-AI System with Active RL
 Includes main system + AI microservice deployment
 """
 
+import importlib.util
+import selectors
+import shlex
 import subprocess
 import sys
 import os
 import time
+from collections import deque, namedtuple
+import shutil
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from pathlib import Path
+from types import MappingProxyType
+
+_RULE = "=" * 60
+
+# Emitted with a single write once deployment finishes
+_BANNER = f"""
+{_RULE}
+🎉 PRODUCTION DEPLOYMENT COMPLETE
+{_RULE}
+
+🌐 ACCESS POINTS:
+   • Main API:      {{main_system}}
+   • API Docs:      {{main_system}}/docs
+   • Dashboard:     {{dashboard}}
+   • AI Microservice: {{ai_microservice}}
+   • Microservice Docs: {{ai_microservice}}/docs
+
+🧠 RL FEATURES:
+   ✅ Active Reinforcement Learning
+   ✅ Real-time Decision Making
+   ✅ Feedback Processing & Learning
+   ✅ Analytics & Visualization
+   ✅ Shashank Platform Integration
+
+🔗 INTEGRATION ENDPOINTS:
+   • Decision API:  POST /ai/decide
+   • Feedback API:  POST /ai/feedback
+   • RL Analytics:  GET /ai/rl-analytics
+   • Shashank API:  /integration/shashank/*
+
+📊 MONITORING:
+   • System Health: GET /health
+   • RL Performance: GET /ai/rl-performance
+   • Brain State:   GET /ai/rl-state
+
+🔧 MANAGEMENT:
+   • Stop services: Ctrl+C
+   • View logs:     logs/ directory
+   • Backup data:   POST /system/backup/create
+
+{_RULE}
+🚀 System is PRODUCTION READY!
+{_RULE}
+"""
+
+_DEFAULT_ENV = """# Production Environment
+ENVIRONMENT=production
+DEBUG=false
+RL_ACTIVE=true
+"""
+
+# One entry per managed service; deploy, monitor, banner and shutdown all read from it
+ServiceSpec = namedtuple("ServiceSpec", "display banner argv cwd health_url public_url wait")
 
 class ProductionDeployer:
     """Deploy HR-AI System to production with all RL features"""
@@ -17,24 +78,80 @@ class ProductionDeployer:
     def __init__(self):
         self.base_dir = Path(__file__).parent
         self.services = {}
+        self.service_logs = {}
+        
+        # Keep-alive session so repeated health probes reuse sockets
+        self.http = requests.Session()
+        self.http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=0))
+        
+        # Service argv lists, built once; list form also survives spaces in sys.executable
+        # Single worker by default: each worker holds its own in-memory RL brain, so with more
+        # than one, feedback trains only the worker that received it
+        workers = int(os.environ.get("UVICORN_WORKERS", 1))
+        cmd_main = [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "0.0.0.0", "--port", "5000", "--workers", str(workers)
+        ]
+        if sys.platform != "win32":
+            # C event loop and HTTP parser (uvloop has no Windows build)
+            cmd_main += ["--loop", "uvloop", "--http", "httptools"]
+        
+        # Loopback probes use the IPv4 literal: no resolver lookup, no IPv6-first fallback
+        self.registry = MappingProxyType({
+            "main_system": ServiceSpec(
+                "Main system", "🚀 Deploying Main HR-AI System...",
+                cmd_main, self.base_dir,
+                "http://127.0.0.1:5000/health", "http://localhost:5000",
+                self._wait_healthy_main_system
+            ),
+            "ai_microservice": ServiceSpec(
+                "AI microservice", "🧠 Deploying AI Brain Microservice...",
+                [sys.executable, "ai_brain_service.py"], self.base_dir / "ai_microservice",
+                "http://127.0.0.1:8080/health", "http://localhost:8080",
+                self._wait_healthy_ai_microservice
+            ),
+            "dashboard": ServiceSpec(
+                "Dashboard", "📊 Deploying Dashboard...",
+                [sys.executable, "-m", "streamlit", "run", "dashboard/app.py",
+                 "--server.port=8501", "--server.headless=true"], self.base_dir,
+                "http://127.0.0.1:8501", "http://localhost:8501",
+                self._wait_healthy_dashboard
+            ),
+        })
+        
+        # Monitor probes run side by side so one dead service doesn't delay the others
+        self.monitor_pool = ThreadPoolExecutor(max_workers=len(self.registry))
         
     def run_command(self, command, description, cwd=None):
-        """Run command with error handling"""
+        """Run command (argv list or string) with error handling, without a shell"""
         print(f"🔄 {description}...")
+        args = command if isinstance(command, list) else shlex.split(command)
+        # Stream output live and keep only a bounded tail for the caller
+        tail = deque(maxlen=200)
         try:
-            result = subprocess.run(
-                command, 
-                shell=True, 
-                check=True, 
-                capture_output=True, 
+            process = subprocess.Popen(
+                args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
+                bufsize=1,
                 cwd=cwd or self.base_dir
             )
-            print(f"✅ {description} completed")
-            return True, result.stdout
-        except subprocess.CalledProcessError as e:
-            print(f"❌ {description} failed: {e.stderr}")
-            return False, e.stderr
+        except OSError as e:
+            print(f"❌ {description} failed: {e}")
+            return False, str(e)
+        
+        with process.stdout:
+            for line in iter(process.stdout.readline, ''):
+                print(f"  | {line}", end='')
+                tail.append(line)
+        output = ''.join(tail)
+        
+        if process.wait() != 0:
+            print(f"❌ {description} failed (exit code {process.returncode})")
+            return False, output
+        print(f"✅ {description} completed")
+        return True, output
     
     def check_dependencies(self):
         """Check all required dependencies"""
@@ -42,20 +159,27 @@ class ProductionDeployer:
         
         required_packages = [
             "fastapi", "uvicorn", "streamlit", "pydantic",
-            "pandas", "numpy", "plotly", "requests"
+            "pandas", "numpy", "plotly", "requests", "orjson"
         ]
+        if sys.platform != "win32":
+            required_packages += ["uvloop", "httptools"]
         
-        missing = []
-        for package in required_packages:
-            try:
-                __import__(package.replace('-', '_'))
-            except ImportError:
-                missing.append(package)
+        # find_spec only locates the module; it doesn't execute pandas/plotly init
+        missing = [
+            package for package in required_packages
+            if importlib.util.find_spec(package.replace('-', '_')) is None
+        ]
         
         if missing:
             print(f"📦 Installing missing packages: {missing}")
+            # One batched install; uv's parallel resolver when present, else a lean pip
+            if shutil.which("uv"):
+                installer = ["uv", "pip", "install", "-q", "--python", sys.executable]
+            else:
+                installer = [sys.executable, "-m", "pip", "install", "-q",
+                             "--disable-pip-version-check", "--prefer-binary", "--no-input"]
             success, _ = self.run_command(
-                f"pip install {' '.join(missing)}", 
+                installer + missing, 
                 "Installing dependencies"
             )
             return success
@@ -74,145 +198,150 @@ class ProductionDeployer:
             "ai_microservice/data"
         ]
         
+        # One scandir per parent instead of a makedirs stat chain per directory
+        existing = {}
         for directory in directories:
-            os.makedirs(self.base_dir / directory, exist_ok=True)
-        
-        # Copy production config
-        if not os.path.exists(self.base_dir / ".env"):
-            if os.path.exists(self.base_dir / ".env.production"):
-                success, _ = self.run_command(
-                    "copy .env.production .env" if os.name == 'nt' else "cp .env.production .env",
-                    "Setting up production config"
-                )
+            target = self.base_dir / directory
+            parent = target.parent
+            if parent not in existing:
+                try:
+                    with os.scandir(parent) as entries:
+                        existing[parent] = {e.name for e in entries if e.is_dir()}
+                except FileNotFoundError:
+                    existing[parent] = set()
+            if target.name not in existing[parent]:
+                target.mkdir(parents=True, exist_ok=True)
+        
+        # Copy production config; "x" mode creates .env atomically and fails if it exists
+        env_path = self.base_dir / ".env"
+        template = self.base_dir / ".env.production"
+        try:
+            with open(env_path, "xb") as dst:
+                try:
+                    with open(template, "rb") as src:
+                        shutil.copyfileobj(src, dst)
+                    copied = True
+                except FileNotFoundError:
+                    # Create basic production config
+                    dst.write(_DEFAULT_ENV.encode())
+                    copied = False
+            if copied:
+                shutil.copystat(template, env_path)
+                print("✅ Production config copied")
             else:
-                # Create basic production config
-                with open(self.base_dir / ".env", "w") as f:
-                    f.write("# Production Environment\n")
-                    f.write("ENVIRONMENT=production\n")
-                    f.write("DEBUG=false\n")
-                    f.write("RL_ACTIVE=true\n")
                 print("✅ Basic production config created")
+        except FileExistsError:
+            pass
         
         print("✅ Production environment ready")
         return True
     
-    def deploy_main_system(self):
-        """Deploy main HR-AI system"""
-        print("🚀 Deploying Main HR-AI System...")
-        
-        # Start main system
-        command = f"{sys.executable} -m uvicorn app.main:app --host 0.0.0.0 --port 5000 --workers 2"
-        
+    def _wait_ready(self, url, timeout=30):
+        """Poll url with exponential backoff until it answers 200; returns the response or None"""
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            try:
+                response = self.http.get(url, timeout=(1, 10))
+                if response.status_code == 200:
+                    return response
+            except requests.RequestException:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+        return None
+    
+    def _spawn(self, name):
+        """Launch a registered service with stdout/stderr appended to logs/<name>.out.log"""
+        spec = self.registry[name]
+        log_dir = self.base_dir / "logs"
+        log_dir.mkdir(exist_ok=True)
+        # Unread PIPEs fill up (64KB) and stall a chatty child; a log file never does
+        log_out = open(log_dir / f"{name}.out.log", "ab", buffering=0)
         try:
             process = subprocess.Popen(
-                command.split(),
-                cwd=self.base_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                spec.argv,
+                cwd=spec.cwd,
+                stdout=log_out,
+                stderr=subprocess.STDOUT,
+                # No inherited fds and no preexec_fn keeps CPython on its vfork fast path;
+                # own session so a terminal Ctrl+C reaches only the deployer, which then
+                # shuts services down via stop_services
+                close_fds=True,
+                start_new_session=True
             )
-            
-            self.services['main_system'] = process
-            
-            # Wait for startup
-            time.sleep(5)
-            
-            # Test health
-            try:
-                response = requests.get("http://localhost:5000/health", timeout=10)
-                if response.status_code == 200:
-                    health_data = response.json()
-                    rl_status = health_data.get("ai_brain", {}).get("status", "UNKNOWN")
-                    print(f"✅ Main system deployed - RL Status: {rl_status}")
-                    return True
-                else:
-                    print(f"⚠️ Main system health check failed: {response.status_code}")
-                    return False
-            except Exception as e:
-                print(f"⚠️ Main system health check error: {e}")
-                return False
-                
-        except Exception as e:
-            print(f"❌ Main system deployment failed: {e}")
-            return False
+        except Exception:
+            log_out.close()
+            raise
+        self.services[name] = process
+        self.service_logs[name] = log_out
     
-    def deploy_ai_microservice(self):
-        """Deploy AI Brain microservice"""
-        print("🧠 Deploying AI Brain Microservice...")
+    def _deploy(self, name):
+        """Start one registered service and wait for it to become healthy"""
+        spec = self.registry[name]
+        print(spec.banner)
         
-        microservice_dir = self.base_dir / "ai_microservice"
+        try:
+            self._spawn(name)
+        except Exception as e:
+            print(f"❌ {spec.display} deployment failed: {e}")
+            return False
         
-        # Start microservice
-        command = f"{sys.executable} ai_brain_service.py"
+        return spec.wait()
+    
+    def _wait_healthy_main_system(self):
+        """Wait for the main API to start and verify its health"""
+        response = self._wait_ready(self.registry["main_system"].health_url)
+        if response is None:
+            print("⚠️ Main system health check failed: not ready within 30s")
+            return False
         
         try:
-            process = subprocess.Popen(
-                command.split(),
-                cwd=microservice_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            self.services['ai_microservice'] = process
-            
-            # Wait for startup
-            time.sleep(5)
-            
-            # Test health
-            try:
-                response = requests.get("http://localhost:8080/health", timeout=10)
-                if response.status_code == 200:
-                    health_data = response.json()
-                    rl_status = health_data.get("rl_status", "UNKNOWN")
-                    skills_count = health_data.get("skills_learned", 0)
-                    print(f"✅ AI Microservice deployed - RL: {rl_status}, Skills: {skills_count}")
-                    return True
-                else:
-                    print(f"⚠️ AI Microservice health check failed: {response.status_code}")
-                    return False
-            except Exception as e:
-                print(f"⚠️ AI Microservice health check error: {e}")
-                return False
-                
+            health_data = orjson.loads(response.content)
+            rl_status = health_data.get("ai_brain", {}).get("status", "UNKNOWN")
+            print(f"✅ Main system deployed - RL Status: {rl_status}")
+            return True
         except Exception as e:
-            print(f"❌ AI Microservice deployment failed: {e}")
+            print(f"⚠️ Main system health check error: {e}")
             return False
     
-    def deploy_dashboard(self):
-        """Deploy Streamlit dashboard"""
-        print("📊 Deploying Dashboard...")
-        
-        command = f"{sys.executable} -m streamlit run dashboard/app.py --server.port=8501 --server.headless=true"
+    def deploy_main_system(self):
+        """Deploy main HR-AI system"""
+        return self._deploy("main_system")
+    
+    def _wait_healthy_ai_microservice(self):
+        """Wait for the microservice to start and verify its health"""
+        response = self._wait_ready(self.registry["ai_microservice"].health_url)
+        if response is None:
+            print("⚠️ AI Microservice health check failed: not ready within 30s")
+            return False
         
         try:
-            process = subprocess.Popen(
-                command.split(),
-                cwd=self.base_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            self.services['dashboard'] = process
-            
-            # Wait for startup
-            time.sleep(8)
-            
-            # Test dashboard (basic check)
-            try:
-                response = requests.get("http://localhost:8501", timeout=10)
-                if response.status_code == 200:
-                    print("✅ Dashboard deployed successfully")
-                    return True
-                else:
-                    print(f"⚠️ Dashboard check returned: {response.status_code}")
-                    return True  # Streamlit might return different codes
-            except Exception as e:
-                print(f"⚠️ Dashboard check error (may be normal): {e}")
-                return True  # Dashboard might still be starting
-                
+            health_data = orjson.loads(response.content)
+            rl_status = health_data.get("rl_status", "UNKNOWN")
+            skills_count = health_data.get("skills_learned", 0)
+            print(f"✅ AI Microservice deployed - RL: {rl_status}, Skills: {skills_count}")
+            return True
         except Exception as e:
-            print(f"❌ Dashboard deployment failed: {e}")
+            print(f"⚠️ AI Microservice health check error: {e}")
             return False
     
+    def deploy_ai_microservice(self):
+        """Deploy AI Brain microservice"""
+        return self._deploy("ai_microservice")
+    
+    def _wait_healthy_dashboard(self):
+        """Wait for the dashboard to start (basic reachability check)"""
+        if self._wait_ready(self.registry["dashboard"].health_url, timeout=15) is not None:
+            print("✅ Dashboard deployed successfully")
+        else:
+            print("⚠️ Dashboard not reachable yet (may be normal)")
+        return True  # Dashboard might still be starting
+    
+    def deploy_dashboard(self):
+        """Deploy Streamlit dashboard"""
+        return self._deploy("dashboard")
+    
     def run_integration_tests(self):
         """Run integration tests to verify deployment"""
         print("🧪 Running Integration Tests...")
@@ -220,7 +349,7 @@ class ProductionDeployer:
         try:
             # Run integration tests
             success, output = self.run_command(
-                f"{sys.executable} integration_tests.py",
+                [sys.executable, "integration_tests.py"],
                 "Running integration test suite"
             )
             
@@ -237,43 +366,8 @@ class ProductionDeployer:
     
     def display_deployment_info(self):
         """Display deployment information"""
-        print("\n" + "=" * 60)
-        print("🎉 PRODUCTION DEPLOYMENT COMPLETE")
-        print("=" * 60)
-        
-        print("\n🌐 ACCESS POINTS:")
-        print("   • Main API:      http://localhost:5000")
-        print("   • API Docs:      http://localhost:5000/docs")
-        print("   • Dashboard:     http://localhost:8501")
-        print("   • AI Microservice: http://localhost:8080")
-        print("   • Microservice Docs: http://localhost:8080/docs")
-        
-        print("\n🧠 RL FEATURES:")
-        print("   ✅ Active Reinforcement Learning")
-        print("   ✅ Real-time Decision Making")
-        print("   ✅ Feedback Processing & Learning")
-        print("   ✅ Analytics & Visualization")
-        print("   ✅ Shashank Platform Integration")
-        
-        print("\n🔗 INTEGRATION ENDPOINTS:")
-        print("   • Decision API:  POST /ai/decide")
-        print("   • Feedback API:  POST /ai/feedback")
-        print("   • RL Analytics:  GET /ai/rl-analytics")
-        print("   • Shashank API:  /integration/shashank/*")
-        
-        print("\n📊 MONITORING:")
-        print("   • System Health: GET /health")
-        print("   • RL Performance: GET /ai/rl-performance")
-        print("   • Brain State:   GET /ai/rl-state")
-        
-        print("\n🔧 MANAGEMENT:")
-        print("   • Stop services: Ctrl+C")
-        print("   • View logs:     logs/ directory")
-        print("   • Backup data:   POST /system/backup/create")
-        
-        print("\n" + "=" * 60)
-        print("🚀 System is PRODUCTION READY!")
-        print("=" * 60)
+        sys.stdout.write(_BANNER.format(**{name: spec.public_url for name, spec in self.registry.items()}))
+        sys.stdout.flush()
     
     def deploy_full_system(self):
         """Deploy complete system"""
@@ -290,23 +384,25 @@ class ProductionDeployer:
             print("❌ Environment setup failed")
             return False
         
-        # Step 3: Deploy main system
-        if not self.deploy_main_system():
-            print("❌ Main system deployment failed")
-            return False
+        # Steps 3-5: Start main system, AI microservice and dashboard together;
+        # they have no startup-order dependency, so their warm-up waits overlap
+        for name, spec in self.registry.items():
+            print(spec.banner)
+            try:
+                self._spawn(name)
+            except Exception as e:
+                print(f"❌ {spec.display} deployment failed: {e}")
+                return False
         
-        # Step 4: Deploy AI microservice
-        if not self.deploy_ai_microservice():
-            print("❌ AI microservice deployment failed")
-            return False
+        with ThreadPoolExecutor(max_workers=len(self.registry)) as pool:
+            futures = {pool.submit(spec.wait): spec.display for spec in self.registry.values()}
+            failed = [futures[f] for f in as_completed(futures) if not f.result()]
         
-        # Step 5: Deploy dashboard
-        if not self.deploy_dashboard():
-            print("❌ Dashboard deployment failed")
+        if failed:
+            print(f"❌ {', '.join(failed)} deployment failed")
             return False
         
-        # Step 6: Run integration tests
-        time.sleep(5)  # Allow all services to fully start
+        # Step 6: Run integration tests (every service passed its readiness probe above)
         if not self.run_integration_tests():
             print("⚠️ Integration tests had issues - system may still be functional")
         
@@ -315,13 +411,40 @@ class ProductionDeployer:
         
         return True
     
+    def _handle_child_exit(self, sel, key):
+        """Report a service whose process fd signalled exit"""
+        sel.unregister(key.fileobj)
+        os.close(key.fd)
+        process = self.services[key.data]
+        print(f"⚠️ {key.data} has stopped (exit code {process.wait()}) - see logs/{key.data}.out.log")
+    
     def monitor_services(self):
         """Monitor deployed services"""
         print("\n🔍 Monitoring services... (Press Ctrl+C to stop)")
         
+        # Wake on service exit instead of sleeping blind between health probes;
+        # a pidfd becomes readable the moment its process exits (Linux 5.3+)
+        sel = selectors.DefaultSelector()
+        if hasattr(os, "pidfd_open"):
+            for service_name, process in self.services.items():
+                try:
+                    sel.register(os.pidfd_open(process.pid), selectors.EVENT_READ, service_name)
+                except OSError:
+                    pass  # Already reaped, or kernel without pidfd support
+        
+        next_probe = time.monotonic() + 30
         try:
             while True:
-                time.sleep(30)
+                timeout = max(0, next_probe - time.monotonic())
+                if sel.get_map():
+                    for key, _ in sel.select(timeout):
+                        self._handle_child_exit(sel, key)
+                else:
+                    time.sleep(timeout)
+                
+                if time.monotonic() < next_probe:
+                    continue
+                next_probe = time.monotonic() + 30
                 
                 # Check each service
                 for service_name, process in self.services.items():
@@ -329,36 +452,57 @@ class ProductionDeployer:
                         print(f"⚠️ {service_name} has stopped")
                 
                 # Health checks
-                try:
-                    main_health = requests.get("http://localhost:5000/health", timeout=5)
-                    micro_health = requests.get("http://localhost:8080/health", timeout=5)
-                    
-                    if main_health.status_code != 200:
-                        print("⚠️ Main system health check failed")
-                    
-                    if micro_health.status_code != 200:
-                        print("⚠️ Microservice health check failed")
-                        
-                except Exception as e:
-                    print(f"⚠️ Health check error: {e}")
+                probes = {
+                    spec.display: self.monitor_pool.submit(self.http.get, spec.health_url, timeout=(1, 5))
+                    for spec in self.registry.values()
+                }
+                for name, future in probes.items():
+                    try:
+                        if future.result().status_code != 200:
+                            print(f"⚠️ {name} health check failed")
+                    except Exception as e:
+                        print(f"⚠️ {name} health check error: {e}")
                 
         except KeyboardInterrupt:
             print("\n🛑 Stopping services...")
             self.stop_services()
+        finally:
+            for key in list(sel.get_map().values()):
+                os.close(key.fd)
+            sel.close()
     
     def stop_services(self):
         """Stop all deployed services"""
+        # Signal everything first, then wait in parallel so the 10s grace periods overlap
         for service_name, process in self.services.items():
             try:
                 process.terminate()
-                process.wait(timeout=10)
-                print(f"✅ {service_name} stopped")
             except Exception as e:
                 print(f"⚠️ Error stopping {service_name}: {e}")
-                try:
-                    process.kill()
-                except:
-                    pass
+        
+        if self.services:
+            with ThreadPoolExecutor(max_workers=len(self.services)) as pool:
+                waits = {
+                    pool.submit(process.wait, timeout=10): (service_name, process)
+                    for service_name, process in self.services.items()
+                }
+                for future in as_completed(waits):
+                    service_name, process = waits[future]
+                    try:
+                        future.result()
+                        print(f"✅ {service_name} stopped")
+                    except Exception as e:
+                        print(f"⚠️ Error stopping {service_name}: {e}")
+                        try:
+                            process.kill()
+                        except:
+                            pass
+        
+        for log_out in self.service_logs.values():
+            log_out.close()
+        
+        self.monitor_pool.shutdown(wait=False)
+        self.http.close()
 
 def main():
     """Main deployment function"""
@@ -369,6 +513,8 @@ def main():
             deployer.monitor_services()
         else:
             print("❌ Deployment failed")
+            # Services run in their own sessions, so anything already started would outlive us
+            deployer.stop_services()
             sys.exit(1)
     except KeyboardInterrupt:
         print("\n🛑 Deployment interrupted")
@@ -5,26 +5,131 @@ Now with Reinforced Learning (RL) capabilities!
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import atexit
+import heapq
+import math
+import operator
 import os
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import orjson
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+FLUSH_INTERVAL = 2.0  # Seconds between background flushes of dirty RL state
+
+# Circuit breaker: after this many consecutive connection failures, skip platform calls for a while
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN = 30.0
+
+def _atomic_write(path: str, data: bytes):
+    """Write via a unique temp file + os.replace so readers never see a half-written file
+    and concurrent writers (other workers or processes) never share a temp path"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _flush_periodically(brain_ref, stop: threading.Event):
+    """Background flusher; exits once its brain is garbage collected"""
+    while not stop.wait(FLUSH_INTERVAL):
+        brain = brain_ref()
+        if brain is None:
+            return
+        brain.flush()
+        del brain
+
+def _flush_on_exit(brain_ref):
+    brain = brain_ref()
+    if brain is not None:
+        brain.flush()
+
+class _TTLCache:
+    """Small size-bounded cache whose entries expire after ttl seconds"""
+    
+    def __init__(self, maxsize: int = 256, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            return entry[1]
+    
+    def set(self, key, value):
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))  # Evict the oldest entry
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
 class HRIntelligenceBrain:
     """
     Plug-and-play HR Intelligence Brain for any HR platform
     Includes RL Loop: Decision -> Feedback -> Reward -> Policy Update
     """
     
-    def __init__(self, base_url: str = "http://localhost:5000", api_key: str = None):
+    def __init__(self, base_url: str = "http://localhost:5000", api_key: str = None, pretty: bool = False):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
+        # State files are machine-read; indent them only when a human asks to
+        self._json_option = orjson.OPT_INDENT_2 if pretty else 0
         self.headers = {"Content-Type": "application/json"}
         if api_key:
             self.headers["Authorization"] = f"Bearer {api_key}"
+        
+        # One pooled keep-alive session for every platform call
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                              max_retries=Retry(total=2, backoff_factor=0.1))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._cb = {"fail": 0, "open_until": 0.0}
+        self._cb_lock = threading.Lock()
             
         # ACTIVE RL State - Enhanced Configuration
         self.weights_file = "data/rl_weights.json"
+        self._token_cache: Dict[str, frozenset] = {}  # weight skill -> word set
+        
+        # Read-mostly API results; keys carry the weights version so learning invalidates them
+        self._weights_version = 0
+        self._response_cache = _TTLCache(maxsize=256, ttl=30)
+        
+        # Persistence is batched: updates mark state dirty, a daemon thread writes it out
+        self._dirty = False
+        self._pending_snapshot: Optional[Dict] = None
+        self._last_snapshot_hash: Optional[int] = None  # skips snapshots whose top weights didn't move
+        self._pending_log: deque = deque()  # rl_state_summary.json lines not yet written
+        self._flush_lock = threading.Lock()
+        self._stop_flusher = threading.Event()
+        threading.Thread(
+            target=_flush_periodically, args=(weakref.ref(self), self._stop_flusher),
+            name="rl-weights-flusher", daemon=True
+        ).start()
+        atexit.register(_flush_on_exit, weakref.ref(self))
+        
         self.weights = self._load_weights()
         self.learning_rate = 0.15  # Slightly higher for faster learning
         self.discount_factor = 0.9
@@ -44,60 +149,158 @@ class HRIntelligenceBrain:
             self._save_weights()
             print("RL Brain initialized with enhanced default weights")
         
+    @property
+    def weights(self) -> Dict[str, float]:
+        """Skill -> weight; the dict view of the policy, kept in step with _weights_vec"""
+        return self._weights
+    
+    @weights.setter
+    def weights(self, weights: Dict[str, float]):
+        self._weights = weights
+        self._reindex()
+    
+    def _reindex(self):
+        """Rebuild the SoA view: skill -> index vocab plus a contiguous weight vector"""
+        self._skill_names: List[str] = list(self._weights)
+        self._vocab: Dict[str, int] = {skill: i for i, skill in enumerate(self._skill_names)}
+        # Containment index for skill discovery: all keys joined into one blob plus their lengths
+        self._skills_blob = "\0" + "\0".join(self._skill_names) + "\0"
+        self._skill_lengths = {len(skill) for skill in self._skill_names}
+        self._pull_weights_vec()
+    
+    def _pull_weights_vec(self):
+        self._weights_vec = np.fromiter(self._weights.values(), dtype=np.float64, count=len(self._weights))
+        self._refresh_avg_weight()
+    
+    def _refresh_avg_weight(self):
+        """Cache the mean weight used to normalize predictions; call after any weight change"""
+        self._avg_weight = float(self._weights_vec.mean()) if len(self._weights_vec) else 0.0
+    
+    def _add_skill(self, skill: str, weight: float):
+        """Add a new skill to both the dict and the SoA arrays"""
+        if skill in self._vocab:
+            self._weights[skill] = weight
+            self._weights_vec[self._vocab[skill]] = weight
+            return
+        self._weights[skill] = weight
+        self._vocab[skill] = len(self._skill_names)
+        self._skill_names.append(skill)
+        self._skills_blob += skill + "\0"
+        self._skill_lengths.add(len(skill))
+        self._weights_vec = np.append(self._weights_vec, weight)
+        self._refresh_avg_weight()
+    
+    def _overlaps_known_skill(self, clean_s: str) -> bool:
+        """True if clean_s is within 2 chars in length of, contains, or is contained in a known skill"""
+        if not self._skill_names:
+            return False
+        n = len(clean_s)
+        if any(n + d in self._skill_lengths for d in (-2, -1, 0, 1, 2)):
+            return True
+        # clean_s inside a known skill: one scan over the joined keys
+        if "\0" not in clean_s and clean_s in self._skills_blob:
+            return True
+        # A known skill inside clean_s: only lengths that actually occur need checking
+        for length in self._skill_lengths:
+            if length < n and any(clean_s[i:i + length] in self._vocab for i in range(n - length + 1)):
+                return True
+        return False
+    
     def _load_weights(self) -> Dict[str, float]:
         """Load RL weights from storage"""
         if os.path.exists(self.weights_file):
             try:
-                with open(self.weights_file, 'r') as f:
-                    return json.load(f)
+                with open(self.weights_file, 'rb') as f:
+                    return orjson.loads(f.read())
             except:
                 pass
         return {"python": 1.0, "ai": 1.0, "fastapi": 1.0, "communication": 1.0}
         
     def _save_weights(self):
-        """Save RL weights to storage"""
-        os.makedirs("data", exist_ok=True)
-        try:
-            with open(self.weights_file, 'w') as f:
-                json.dump(self.weights, f, indent=2)
-        except Exception as e:
-            print(f"Failed to save RL weights: {e}")
+        """Mark RL weights for saving; the background flusher persists them"""
+        self._weights_version += 1
+        self._dirty = True
+    
+    def flush(self):
+        """Write pending RL weights, log lines and state snapshot to disk"""
+        with self._flush_lock:
+            if self._dirty:
+                # Cleared before the copy so an update racing the write marks the state dirty again
+                self._dirty = False
+                weights = dict(self.weights)
+                try:
+                    os.makedirs("data", exist_ok=True)
+                    _atomic_write(self.weights_file, orjson.dumps(weights, option=self._json_option))
+                except Exception as e:
+                    self._dirty = True  # retried on the next flush
+                    print(f"Failed to save RL weights: {e}")
+            
+            log_lines = []
+            while self._pending_log:  # popleft is thread-safe against concurrent appends
+                log_lines.append(self._pending_log.popleft())
+            snapshot, self._pending_snapshot = self._pending_snapshot, None
+            if log_lines or snapshot is not None:
+                try:
+                    os.makedirs("logs", exist_ok=True)
+                except Exception as e:
+                    print(f"RL Logging failed: {e}")
+            if log_lines:
+                try:
+                    # One append per batch keeps each flush's lines contiguous in the file
+                    with open("logs/rl_state_summary.json", "ab") as f:
+                        f.write(b"".join(log_lines))
+                except Exception as e:
+                    self._pending_log.extendleft(reversed(log_lines))  # requeue ahead of newer lines
+                    print(f"RL Logging failed: {e}")
+            if snapshot is not None:
+                try:
+                    _atomic_write("logs/rl_current_state.json", orjson.dumps(snapshot, option=self._json_option))
+                except Exception as e:
+                    if self._pending_snapshot is None:  # a newer snapshot supersedes this one
+                        self._pending_snapshot = snapshot
+                    print(f"RL Logging failed: {e}")
 
+    def _skill_tokens(self, skill: str) -> frozenset:
+        """Word set of a weight skill, memoized (a string's tokens never change)"""
+        tokens = self._token_cache.get(skill)
+        if tokens is None:
+            tokens = self._token_cache[skill] = frozenset(skill.split())
+        return tokens
+
+    def _do_request(self, method: str, path: str, **kwargs) -> Optional[requests.Response]:
+        """Platform call through the circuit breaker; None when the call failed or was skipped"""
+        if time.monotonic() < self._cb["open_until"]:
+            return None
+        try:
+            response = self._session.request(method, f"{self.base_url}{path}", **kwargs)
+        except requests.RequestException:
+            response = None
+        
+        with self._cb_lock:
+            # 4xx still proves the platform is reachable; only outages count against it
+            if response is None or response.status_code >= 500:
+                self._cb["fail"] += 1
+                if self._cb["fail"] >= BREAKER_THRESHOLD:
+                    self._cb["open_until"] = time.monotonic() + BREAKER_COOLDOWN
+            else:
+                self._cb["fail"] = 0
+                self._cb["open_until"] = 0.0
+        return response
+    
     # Core Intelligence Functions
     def analyze_candidate(self, candidate_data: Dict) -> Dict:
         """ACTIVE RL: Analyze candidate with real-time learning"""
         try:
             # Enhanced RL analysis with confidence metrics
-            rl_score = self.predict_success(candidate_data)
-            
-            # Calculate confidence based on skill matches
-            skills = candidate_data.get("skills", [])
-            matched_weights = []
-            for skill in skills:
-                for weight_skill, weight in self.weights.items():
-                    if weight_skill.lower() in skill.lower() or skill.lower() in weight_skill.lower():
-                        matched_weights.append(weight)
-            
-            confidence = min(0.95, len(matched_weights) / max(len(skills), 1) * 0.8 + 0.2)
+            result = self._rl_analysis(candidate_data, self.predict_success(candidate_data))
             
             # Try to get additional insights from API
             try:
-                response = requests.post(f"{self.base_url}/smart/analyze", 
-                                       json=candidate_data, headers=self.headers, timeout=3)
-                api_result = response.json() if response.status_code == 200 else {}
+                response = self._do_request("POST", "/smart/analyze", json=candidate_data, timeout=3)
+                api_result = response.json() if response is not None and response.status_code == 200 else {}
             except:
                 api_result = {}
             
-            # Combine RL insights with API results
-            result = {
-                "rl_success_probability": rl_score,
-                "rl_confidence": confidence,
-                "rl_matched_skills": len(matched_weights),
-                "rl_total_weights": len(self.weights),
-                "rl_status": "ACTIVE",
-                "analysis_timestamp": datetime.now().isoformat()
-            }
-            
             # Merge API results if available
             if api_result and "error" not in api_result:
                 result.update(api_result)
@@ -111,19 +314,68 @@ class HRIntelligenceBrain:
                 "rl_status": "ACTIVE_FALLBACK"
             }
     
+    def analyze_candidates_batch(self, candidates: List[Dict]) -> List[Dict]:
+        """Analyze many candidates with one /smart/analyze_batch call and vectorized RL scoring"""
+        response = self._do_request("POST", "/smart/analyze_batch", json={"candidates": candidates}, timeout=5)
+        
+        # Server without the batch endpoint: use the per-candidate path
+        if response is not None and response.status_code == 404:
+            return [self.analyze_candidate(candidate) for candidate in candidates]
+        
+        try:
+            api_results = response.json().get("results", []) if response is not None and response.status_code == 200 else []
+        except:
+            api_results = []
+        
+        results = []
+        for i, (candidate_data, rl_score) in enumerate(zip(candidates, self.predict_success_batch(candidates).tolist())):
+            result = self._rl_analysis(candidate_data, rl_score)
+            api_result = api_results[i] if i < len(api_results) else {}
+            if api_result and "error" not in api_result:
+                result.update(api_result)
+            results.append(result)
+        return results
+    
+    def _rl_analysis(self, candidate_data: Dict, rl_score: float) -> Dict:
+        """RL part of a candidate analysis: success probability plus skill-match confidence"""
+        # Calculate confidence based on skill matches
+        skills = candidate_data.get("skills", [])
+        matched_weights = []
+        for skill in skills:
+            for weight_skill, weight in self.weights.items():
+                if weight_skill.lower() in skill.lower() or skill.lower() in weight_skill.lower():
+                    matched_weights.append(weight)
+        
+        confidence = min(0.95, len(matched_weights) / max(len(skills), 1) * 0.8 + 0.2)
+        
+        return {
+            "rl_success_probability": rl_score,
+            "rl_confidence": confidence,
+            "rl_matched_skills": len(matched_weights),
+            "rl_total_weights": len(self.weights),
+            "rl_status": "ACTIVE",
+            "analysis_timestamp": datetime.now().isoformat()
+        }
+    
     def get_recommendations(self, candidate_id: int) -> List[str]:
         """Get RL-enhanced AI recommendations for candidate"""
+        cache_key = ("recommendations", candidate_id, self._weights_version)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
         try:
             # Try API first
-            response = requests.get(f"{self.base_url}/smart/recommendations/{candidate_id}", 
-                                  headers=self.headers, timeout=3)
+            response = self._do_request("GET", f"/smart/recommendations/{candidate_id}", timeout=3)
+            if response is None:
+                raise requests.ConnectionError("HR platform unreachable")
             api_recommendations = response.json().get("recommendations", []) if response.status_code == 200 else []
             
             # Generate RL-based recommendations
             rl_recommendations = []
             
             # Get top weighted skills for recommendations
-            top_skills = sorted(self.weights.items(), key=lambda x: x[1], reverse=True)[:5]
+            top_skills = heapq.nlargest(5, self.weights.items(), key=operator.itemgetter(1))
             
             for skill, weight in top_skills:
                 if weight > 1.2:
@@ -138,11 +390,13 @@ class HRIntelligenceBrain:
             if len(self.weights) > 10:
                 all_recommendations.append(f"RL Brain has learned from {len(self.weights)} skills")
             
-            return all_recommendations[:10]  # Limit to top 10
+            all_recommendations = all_recommendations[:10]  # Limit to top 10
+            self._response_cache.set(cache_key, all_recommendations)
+            return list(all_recommendations)
             
         except Exception as e:
             # Fallback to RL-only recommendations
-            top_skills = sorted(self.weights.items(), key=lambda x: x[1], reverse=True)[:3]
+            top_skills = heapq.nlargest(3, self.weights.items(), key=operator.itemgetter(1))
             return [f"Consider skills in: {skill} (importance: {weight:.2f})" for skill, weight in top_skills]
     
     def predict_success(self, candidate_data: Dict) -> float:
@@ -153,48 +407,26 @@ class HRIntelligenceBrain:
                 return 0.2  # Base probability for no skills
             
             # Enhanced scoring with fuzzy matching
-            total_score = 0.0
-            matched_skills = []
             normalized_skills = [s.lower().strip() for s in skills]
-            
-            for skill, weight in self.weights.items():
-                skill_score = 0.0
-                
-                # Exact match (highest score)
-                if skill in normalized_skills:
-                    skill_score = weight
-                    matched_skills.append((skill, weight, "exact"))
-                else:
-                    # Fuzzy matching for partial skills
-                    for candidate_skill in normalized_skills:
-                        if skill in candidate_skill or candidate_skill in skill:
-                            skill_score = weight * 0.8  # Partial match penalty
-                            matched_skills.append((skill, weight * 0.8, "partial"))
-                            break
-                        elif len(set(skill.split()) & set(candidate_skill.split())) > 0:
-                            skill_score = weight * 0.6  # Word overlap
-                            matched_skills.append((skill, weight * 0.6, "overlap"))
-                            break
-                
-                total_score += skill_score
+            factors = self._match_factors(normalized_skills)
+            total_score = float(np.dot(factors, self._weights_vec))
+            matched_count = sum(1 for f in factors if f)
             
             # Dynamic normalization based on current weights distribution
             if self.weights:
-                avg_weight = sum(self.weights.values()) / len(self.weights)
-                max_possible = len(normalized_skills) * avg_weight
+                max_possible = len(normalized_skills) * self._avg_weight
                 normalized_score = total_score / max(max_possible, 1.0)
             else:
                 normalized_score = 0.0
             
             # Apply sigmoid transformation for smooth probability
-            import math
             probability = 1 / (1 + math.exp(-5 * (normalized_score - 0.5)))
             
             # Ensure reasonable bounds
             probability = max(0.05, min(0.95, probability))
             
             # Log prediction details for transparency
-            print(f"RL Prediction: {len(matched_skills)} skills matched, score: {total_score:.2f}, prob: {probability:.3f}")
+            print(f"RL Prediction: {matched_count} skills matched, score: {total_score:.2f}, prob: {probability:.3f}")
             
             return round(probability, 3)
             
@@ -202,11 +434,53 @@ class HRIntelligenceBrain:
             print(f"RL Prediction failed: {e}")
             return 0.2
     
-    def reward_log(self, candidate_data: Dict, feedback_score: float, outcome: str):
+    def _match_factors(self, normalized_skills: List[str]) -> List[float]:
+        """Per-weight match strength (1.0 exact, 0.8 partial, 0.6 word overlap, 0.0 none), in weights order"""
+        candidate_tokens = [(s, frozenset(s.split())) for s in normalized_skills]
+        
+        # Exact match (highest score) - one hash intersection
+        exact = self.weights.keys() & set(normalized_skills)
+        
+        factors = []
+        for skill in self.weights:
+            factor = 0.0
+            if skill in exact:
+                factor = 1.0
+            else:
+                # Fuzzy matching for partial skills, only over the unmatched keys
+                tokens = self._skill_tokens(skill)
+                for candidate_skill, words in candidate_tokens:
+                    if skill in candidate_skill or candidate_skill in skill:
+                        factor = 0.8  # Partial match penalty
+                        break
+                    elif not tokens.isdisjoint(words):
+                        factor = 0.6  # Word overlap
+                        break
+            factors.append(factor)
+        return factors
+    
+    def predict_success_batch(self, candidates: List[Dict]) -> np.ndarray:
+        """Vectorized predict_success for many candidates: one (N, W) match matrix times the weight vector"""
+        weights = self._weights_vec
+        skill_lists = [[s.lower().strip() for s in c.get("skills", [])] for c in candidates]
+        
+        matches = np.array([self._match_factors(skills) for skills in skill_lists], dtype=np.float64)
+        matches = matches.reshape(len(candidates), len(weights))
+        total_scores = matches @ weights
+        
+        skill_counts = np.array([len(skills) for skills in skill_lists], dtype=np.float64)
+        normalized_scores = total_scores / np.maximum(skill_counts * self._avg_weight, 1.0)
+        
+        probabilities = np.clip(1 / (1 + np.exp(-5 * (normalized_scores - 0.5))), 0.05, 0.95)
+        probabilities[skill_counts == 0] = 0.2  # Base probability for no skills
+        return np.round(probabilities, 3)
+    
+    def reward_log(self, candidate_data: Dict, feedback_score: float, outcome: str) -> Dict:
         """
         ACTIVE RL: Log feedback and update policy (weights)
         feedback_score: 1.0 to 5.0
         outcome: 'hired', 'rejected', etc.
+        Returns the before/after predictions and reward so callers don't re-score
         """
         # Calculate reward with enhanced logic
         reward = self._calculate_reward(feedback_score, outcome)
@@ -220,9 +494,14 @@ class HRIntelligenceBrain:
         # Get prediction after update to measure learning
         new_prediction = self.predict_success(candidate_data)
         
+        # One clock read per feedback, shared by the log line and the snapshot
+        ts_ns = time.time_ns()
+        timestamp = datetime.fromtimestamp(ts_ns / 1e9).isoformat()
+        
         # Enhanced logging with learning metrics
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
+            "ts_ns": ts_ns,
             "candidate": candidate_data.get("name", "Unknown"),
             "candidate_id": candidate_data.get("id", "N/A"),
             "skills": candidate_data.get("skills", []),
@@ -237,28 +516,33 @@ class HRIntelligenceBrain:
             "learning_rate": self.learning_rate
         }
         
-        # Save to structured log file
+        # Save to structured log file (buffered; written out by flush)
         try:
-            os.makedirs("logs", exist_ok=True)
-            with open("logs/rl_state_summary.json", "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
-            
-            # Also save current state snapshot
-            state_snapshot = {
-                "timestamp": datetime.now().isoformat(),
-                "total_weights": len(self.weights),
-                "top_weights": dict(sorted(self.weights.items(), key=lambda x: x[1], reverse=True)[:10]),
-                "learning_rate": self.learning_rate,
-                "last_reward": reward
-            }
+            self._pending_log.append(orjson.dumps(log_entry) + b"\n")
             
-            with open("logs/rl_current_state.json", "w") as f:
-                json.dump(state_snapshot, f, indent=2)
+            # Also save current state snapshot, unless the tracked state is unchanged
+            top_weights = heapq.nlargest(10, self.weights.items(), key=operator.itemgetter(1))
+            snapshot_hash = hash((tuple(top_weights), len(self.weights), self.learning_rate))
+            if snapshot_hash != self._last_snapshot_hash:
+                self._last_snapshot_hash = snapshot_hash
+                self._pending_snapshot = {
+                    "timestamp": timestamp,
+                    "total_weights": len(self.weights),
+                    "top_weights": dict(top_weights),
+                    "learning_rate": self.learning_rate,
+                    "last_reward": reward
+                }
                 
             print(f"RL Learning Complete: Reward={reward:.3f}, Delta={new_prediction-old_prediction:.3f}")
             
         except Exception as e:
             print(f"RL Logging failed: {e}")
+        
+        return {
+            "prediction_before": old_prediction,
+            "prediction_after": new_prediction,
+            "reward": reward
+        }
 
     def _calculate_reward(self, feedback_score: float, outcome: str) -> float:
         """Enhanced reward calculation for active RL"""
@@ -284,6 +568,38 @@ class HRIntelligenceBrain:
         # Apply bounds to prevent extreme updates
         return max(-2.0, min(2.0, total_reward))
 
+    def _matched_indices(self, normalized_skills: List[str]) -> np.ndarray:
+        """Indices of weights whose skill is one of, or a substring of, the candidate's skills"""
+        # Exact hits resolve by hash; substring scan only for the rest
+        exact_hits = self.weights.keys() & set(normalized_skills)
+        return np.fromiter(
+            (i for i, skill in enumerate(self._skill_names)
+             if skill in exact_hits or any(skill in s for s in normalized_skills)),
+            dtype=np.int64
+        )
+    
+    def _discover_skills(self, normalized_skills: List[str], reward: float) -> bool:
+        """Add candidate skills that don't overlap a known one; True if any were added"""
+        added = False
+        for s in normalized_skills:
+            clean_s = s.strip().lower()
+            
+            # Check if skill already exists (fuzzy matching)
+            should_add = not self._overlaps_known_skill(clean_s)
+            
+            if should_add and len(clean_s) < 25 and len(clean_s) > 2:
+                initial_weight = 1.0 + (self.learning_rate * reward * 2)  # Boost new skills
+                self._add_skill(clean_s, max(0.5, min(3.0, initial_weight)))
+                added = True
+                print(f"RL Discovery: New skill '{clean_s}' added with weight {self.weights[clean_s]:.3f}")
+        return added
+    
+    def _decay_mask(self, normalized_skills: List[str]) -> np.ndarray:
+        """Weights that decay after an update: every skill the candidate doesn't name exactly"""
+        decay = np.ones(len(self._skill_names), dtype=bool)
+        decay[[self._vocab[s] for s in set(normalized_skills) if s in self._vocab]] = False
+        return decay
+
     def policy_update(self, candidate_data: Dict, reward: float):
         """
         Update weights (Policy) based on reward - FULLY ACTIVE RL
@@ -293,46 +609,123 @@ class HRIntelligenceBrain:
         normalized_skills = [s.lower() for s in skills]
         
         updated = False
+        matched = self._matched_indices(normalized_skills)
         
-        # Update existing weights with decay to prevent overfitting
-        for skill in self.weights:
-            if any(skill in s for s in normalized_skills):
-                old_weight = self.weights[skill]
-                # Enhanced update rule with momentum and bounds
-                weight_change = self.learning_rate * reward
-                self.weights[skill] = max(0.1, min(5.0, old_weight + weight_change))
-                updated = True
-                
+        # Update existing weights in one vectorized step, with bounds
+        if matched.size:
+            old_weights = self._weights_vec[matched]
+            new_weights = np.clip(old_weights + self.learning_rate * reward, 0.1, 5.0)
+            self._weights_vec[matched] = new_weights
+            updated = True
+            
+            for i, old_weight, new_weight in zip(matched.tolist(), old_weights.tolist(), new_weights.tolist()):
+                skill = self._skill_names[i]
+                self._weights[skill] = new_weight
                 # Log weight changes for transparency
-                print(f"RL Update: {skill} weight {old_weight:.3f} -> {self.weights[skill]:.3f} (reward: {reward:.3f})")
+                print(f"RL Update: {skill} weight {old_weight:.3f} -> {new_weight:.3f} (reward: {reward:.3f})")
         
         # Add new skills with adaptive thresholds
         if reward > 0.3:  # Lower threshold for skill discovery
-            for s in normalized_skills:
-                clean_s = s.strip().lower()
-                should_add = True
-                
-                # Check if skill already exists (fuzzy matching)
-                for existing in self.weights:
-                    if existing in clean_s or clean_s in existing or abs(len(existing) - len(clean_s)) < 3:
-                        should_add = False
-                        break
-                
-                if should_add and len(clean_s) < 25 and len(clean_s) > 2:
-                    initial_weight = 1.0 + (self.learning_rate * reward * 2)  # Boost new skills
-                    self.weights[clean_s] = max(0.5, min(3.0, initial_weight))
-                    updated = True
-                    print(f"RL Discovery: New skill '{clean_s}' added with weight {self.weights[clean_s]:.3f}")
+            updated = self._discover_skills(normalized_skills, reward) or updated
 
         # Apply weight decay to prevent stagnation
         if updated:
-            for skill in self.weights:
-                if skill not in [s.lower() for s in normalized_skills]:
-                    self.weights[skill] *= 0.999  # Slight decay for unused skills
+            self._weights_vec[self._decay_mask(normalized_skills)] *= 0.999  # Slight decay for unused skills
+            self._weights.update(zip(self._skill_names, self._weights_vec.tolist()))
+            self._refresh_avg_weight()
             
             self._save_weights()
             print(f"RL Policy Updated: {len(self.weights)} skills tracked")
 
+    def reward_log_batch(self, candidate_data: Dict, feedback_scores, outcomes: List[str]) -> Dict:
+        """
+        ACTIVE RL: reward_log for many feedback items on one candidate, applied in order.
+        Ends in the same weights as calling reward_log per item, but each step is a couple of
+        array operations; predictions are taken once before and once after the whole batch.
+        """
+        scores = np.asarray(feedback_scores, dtype=np.float64)
+        rewards = np.array([self._calculate_reward(score, outcome)
+                            for score, outcome in zip(scores.tolist(), outcomes)], dtype=np.float64)
+        
+        old_prediction = self.predict_success(candidate_data)
+        
+        normalized_skills = [s.lower() for s in candidate_data.get("skills", [])]
+        matched = self._matched_indices(normalized_skills)
+        decay = self._decay_mask(normalized_skills)
+        discovered = False
+        any_update = False
+        
+        for reward in rewards.tolist():
+            updated = bool(matched.size)
+            if updated:
+                self._weights_vec[matched] = np.clip(self._weights_vec[matched] + self.learning_rate * reward, 0.1, 5.0)
+            # Discovery can only add skills the first time it runs; later runs see them as known
+            if reward > 0.3 and not discovered:
+                discovered = True
+                if self._discover_skills(normalized_skills, reward):
+                    updated = True
+                    matched = self._matched_indices(normalized_skills)
+                    decay = self._decay_mask(normalized_skills)
+            if updated:
+                self._weights_vec[decay] *= 0.999  # Slight decay for unused skills
+                any_update = True
+        
+        if any_update:
+            self._weights.update(zip(self._skill_names, self._weights_vec.tolist()))
+            self._refresh_avg_weight()
+            self._save_weights()
+            print(f"RL Policy Updated: {len(rewards)} feedback items, {len(self.weights)} skills tracked")
+        
+        new_prediction = self.predict_success(candidate_data)
+        
+        ts_ns = time.time_ns()
+        timestamp = datetime.fromtimestamp(ts_ns / 1e9).isoformat()
+        
+        # One log line per item so analytics still count every feedback; predictions are batch-level
+        try:
+            base_entry = {
+                "timestamp": timestamp,
+                "ts_ns": ts_ns,
+                "candidate": candidate_data.get("name", "Unknown"),
+                "candidate_id": candidate_data.get("id", "N/A"),
+                "skills": candidate_data.get("skills", []),
+                "prediction_before": old_prediction,
+                "prediction_after": new_prediction,
+                "learning_delta": new_prediction - old_prediction,
+                "weights_count": len(self.weights),
+                "active_weights": {k: v for k, v in self.weights.items() if v > 1.0},
+                "learning_rate": self.learning_rate,
+                "batch_size": len(rewards)
+            }
+            for index, (score, outcome, reward) in enumerate(zip(scores.tolist(), outcomes, rewards.tolist())):
+                self._pending_log.append(orjson.dumps({
+                    **base_entry,
+                    "feedback_score": score,
+                    "outcome": outcome,
+                    "calculated_reward": reward,
+                    "batch_index": index
+                }) + b"\n")
+            
+            top_weights = heapq.nlargest(10, self.weights.items(), key=operator.itemgetter(1))
+            snapshot_hash = hash((tuple(top_weights), len(self.weights), self.learning_rate))
+            if snapshot_hash != self._last_snapshot_hash:
+                self._last_snapshot_hash = snapshot_hash
+                self._pending_snapshot = {
+                    "timestamp": timestamp,
+                    "total_weights": len(self.weights),
+                    "top_weights": dict(top_weights),
+                    "learning_rate": self.learning_rate,
+                    "last_reward": float(rewards[-1]) if len(rewards) else 0.0
+                }
+        except Exception as e:
+            print(f"RL Logging failed: {e}")
+        
+        return {
+            "prediction_before": old_prediction,
+            "prediction_after": new_prediction,
+            "rewards": rewards.tolist()
+        }
+
     def trigger_automation(self, candidate_id: int, event_type: str, metadata: Dict = None) -> Dict:
         """Trigger multi-channel automation"""
         try:
@@ -341,8 +734,9 @@ class HRIntelligenceBrain:
                 "event_type": event_type,
                 "metadata": metadata or {}
             }
-            response = requests.post(f"{self.base_url}/trigger/", 
-                                   json=data, headers=self.headers)
+            response = self._do_request("POST", "/trigger/", json=data, timeout=5)
+            if response is None:
+                return {"error": "Connection failed"}
             return response.json() if response.status_code == 200 else {"error": "Automation failed"}
         except:
             return {"error": "Connection failed"}
@@ -359,27 +753,50 @@ class HRIntelligenceBrain:
         }
         
         try:
-            response = requests.post(f"{self.base_url}/candidate/add", 
-                                   json=internal_candidate, headers=self.headers)
+            response = self._do_request("POST", "/candidate/add", json=internal_candidate, timeout=5)
+            if response is None:
+                return {"error": "Connection failed"}
             return response.json() if response.status_code == 200 else {"error": "Sync failed"}
         except:
             return {"error": "Connection failed"}
     
     def get_insights_dashboard(self) -> Dict:
         """Get complete dashboard insights for external platform"""
+        cache_key = ("insights", self._weights_version)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            response = requests.get(f"{self.base_url}/analytics/dashboard", headers=self.headers)
-            return response.json() if response.status_code == 200 else {}
+            response = self._do_request("GET", "/analytics/dashboard", timeout=3)
+            if response is None or response.status_code != 200:
+                return {}
+            insights = response.json()
+            self._response_cache.set(cache_key, insights)
+            return dict(insights)
         except:
             return {}
     
     def health_check(self) -> bool:
         """Check if HR Intelligence Brain is healthy"""
         try:
-            response = requests.get(f"{self.base_url}/health", headers=self.headers)
-            return response.status_code == 200
+            response = self._do_request("GET", "/health", timeout=3)
+            return response is not None and response.status_code == 200
         except:
             return False
+    
+    # Async variants: run the pooled-session calls off the event loop so callers can gather many
+    async def analyze_candidate_async(self, candidate_data: Dict) -> Dict:
+        return await asyncio.to_thread(self.analyze_candidate, candidate_data)
+    
+    async def get_recommendations_async(self, candidate_id: int) -> List[str]:
+        return await asyncio.to_thread(self.get_recommendations, candidate_id)
+    
+    async def trigger_automation_async(self, candidate_id: int, event_type: str, metadata: Dict = None) -> Dict:
+        return await asyncio.to_thread(self.trigger_automation, candidate_id, event_type, metadata)
+    
+    async def sync_candidate_async(self, external_candidate: Dict) -> Dict:
+        return await asyncio.to_thread(self.sync_candidate, external_candidate)
 
 # Shashank's Platform Integration Adapter
 class ShashankHRAdapter:
@@ -388,73 +805,112 @@ class ShashankHRAdapter:
     def __init__(self, shashank_api_url: str, hr_brain: HRIntelligenceBrain):
         self.shashank_api = shashank_api_url
         self.hr_brain = hr_brain
+        self._executor = ThreadPoolExecutor(max_workers=4)
     
     def connect_to_shashank_platform(self) -> bool:
         """Establish connection to Shashank's HR platform"""
         return self.hr_brain.health_check()
     
+    @staticmethod
+    def _candidate_data(shashank_candidate: Dict) -> Dict:
+        """Map a Shashank platform record to the brain's candidate format"""
+        return {
+            "name": shashank_candidate.get("full_name") or shashank_candidate.get("name"),
+            "email": shashank_candidate.get("email_address") or shashank_candidate.get("email"),
+            "phone": shashank_candidate.get("phone_number") or shashank_candidate.get("phone"),
+            "skills": shashank_candidate.get("skills", [])
+        }
+    
+    @staticmethod
+    def _processed_result(candidate_id, candidate_data: Dict, analysis: Dict, recommendations: List[str]) -> Dict:
+        """Enhanced result with RL metrics"""
+        result = {
+            "candidate_id": candidate_id,
+            "candidate_name": candidate_data["name"],
+            "success_probability": analysis.get("rl_success_probability", 0),
+            "confidence": analysis.get("rl_confidence", 0),
+            "ai_recommendations": recommendations,
+            "rl_metrics": {
+                "matched_skills": analysis.get("rl_matched_skills", 0),
+                "total_weights": analysis.get("rl_total_weights", 0),
+                "learning_status": "ACTIVE",
+                "brain_version": "v2.0_active"
+            },
+            "status": "processed",
+            "processing_timestamp": datetime.now().isoformat()
+        }
+        
+        # Add API analysis if available
+        if "error" not in analysis:
+            result["extended_analysis"] = analysis
+        
+        return result
+    
+    @staticmethod
+    def _failed_result(shashank_candidate: Dict, error: Exception) -> Dict:
+        return {
+            "error": f"Processing failed: {error}",
+            "candidate_name": shashank_candidate.get("full_name", "Unknown"),
+            "rl_status": "ERROR_FALLBACK"
+        }
+    
     def process_shashank_candidate(self, shashank_candidate: Dict) -> Dict:
         """Process candidate from Shashank's platform with ACTIVE RL"""
         try:
             # Enhanced candidate data preparation
-            candidate_data = {
-                "name": shashank_candidate.get("full_name") or shashank_candidate.get("name"),
-                "email": shashank_candidate.get("email_address") or shashank_candidate.get("email"),
-                "phone": shashank_candidate.get("phone_number") or shashank_candidate.get("phone"),
-                "skills": shashank_candidate.get("skills", [])
-            }
-            
-            # Sync candidate to HR Brain (optional, for full integration)
-            sync_result = self.hr_brain.sync_candidate(shashank_candidate)
-            candidate_id = sync_result.get("candidate_id", "temp_id")
+            candidate_data = self._candidate_data(shashank_candidate)
             
-            # Get ACTIVE RL analysis
-            analysis = self.hr_brain.analyze_candidate(candidate_data)
+            # Sync (optional, for full integration) and ACTIVE RL analysis are independent
+            # round-trips, so issue them together
+            sync_future = self._executor.submit(self.hr_brain.sync_candidate, shashank_candidate)
+            analysis_future = self._executor.submit(self.hr_brain.analyze_candidate, candidate_data)
             
-            # Get RL-enhanced recommendations
+            # Recommendations need the synced id; fetch them while the analysis finishes
+            candidate_id = sync_future.result().get("candidate_id", "temp_id")
             recommendations = self.hr_brain.get_recommendations(candidate_id)
+            analysis = analysis_future.result()
             
-            # Enhanced result with RL metrics
-            result = {
-                "candidate_id": candidate_id,
-                "candidate_name": candidate_data["name"],
-                "success_probability": analysis.get("rl_success_probability", 0),
-                "confidence": analysis.get("rl_confidence", 0),
-                "ai_recommendations": recommendations,
-                "rl_metrics": {
-                    "matched_skills": analysis.get("rl_matched_skills", 0),
-                    "total_weights": analysis.get("rl_total_weights", 0),
-                    "learning_status": "ACTIVE",
-                    "brain_version": "v2.0_active"
-                },
-                "status": "processed",
-                "processing_timestamp": datetime.now().isoformat()
-            }
-            
-            # Add API analysis if available
-            if "error" not in analysis:
-                result["extended_analysis"] = analysis
-            
-            return result
+            return self._processed_result(candidate_id, candidate_data, analysis, recommendations)
             
         except Exception as e:
-            return {
-                "error": f"Processing failed: {e}",
-                "candidate_name": shashank_candidate.get("full_name", "Unknown"),
-                "rl_status": "ERROR_FALLBACK"
-            }
+            return self._failed_result(shashank_candidate, e)
+    
+    def process_shashank_candidates(self, shashank_candidates: List[Dict]) -> List[Dict]:
+        """Process many candidates with a single batched analysis call; results keep input order"""
+        candidates_data = [self._candidate_data(c) for c in shashank_candidates]
+        sync_futures = [self._executor.submit(self.hr_brain.sync_candidate, c) for c in shashank_candidates]
+        
+        try:
+            analyses = self.hr_brain.analyze_candidates_batch(candidates_data)
+        except Exception as e:
+            return [self._failed_result(c, e) for c in shashank_candidates]
+        
+        results = []
+        for shashank_candidate, candidate_data, sync_future, analysis in zip(
+                shashank_candidates, candidates_data, sync_futures, analyses):
+            try:
+                candidate_id = sync_future.result().get("candidate_id", "temp_id")
+                recommendations = self.hr_brain.get_recommendations(candidate_id)
+                results.append(self._processed_result(candidate_id, candidate_data, analysis, recommendations))
+            except Exception as e:
+                results.append(self._failed_result(shashank_candidate, e))
+        return results
+    
+    async def process_async(self, shashank_candidate: Dict) -> Dict:
+        """Async process_shashank_candidate for event-loop callers"""
+        return await asyncio.to_thread(self.process_shashank_candidate, shashank_candidate)
+    
+    async def process_candidates_async(self, shashank_candidates: List[Dict]) -> List[Dict]:
+        """Process many candidates concurrently; results keep input order"""
+        return list(await asyncio.gather(*(self.process_async(c) for c in shashank_candidates)))
     
     def feedback_loop(self, candidate_data: Dict, score: float, outcome: str):
         """ACTIVE RL: Process feedback from Shashank's platform to update Brain"""
         try:
-            # Get prediction before learning
-            old_prediction = self.hr_brain.predict_success(candidate_data)
-            
-            # Apply RL learning
-            self.hr_brain.reward_log(candidate_data, score, outcome)
-            
-            # Get prediction after learning
-            new_prediction = self.hr_brain.predict_success(candidate_data)
+            # Apply RL learning; reward_log already scores before and after the update
+            learning = self.hr_brain.reward_log(candidate_data, score, outcome)
+            old_prediction = learning["prediction_before"]
+            new_prediction = learning["prediction_after"]
             
             # Calculate learning metrics
             learning_delta = new_prediction - old_prediction
@@ -487,7 +943,7 @@ class ShashankHRAdapter:
             insights = self.hr_brain.get_insights_dashboard()
             
             # Enhanced RL-specific insights
-            top_skills = sorted(self.hr_brain.weights.items(), key=lambda x: x[1], reverse=True)[:10]
+            top_skills = heapq.nlargest(10, self.hr_brain.weights.items(), key=operator.itemgetter(1))
             
             # Calculate learning metrics
             total_weights = len(self.hr_brain.weights)
@@ -520,12 +976,12 @@ class ShashankHRAdapter:
             }
 
 # Simple Integration Example
-def create_hr_brain_for_shashank(shashank_platform_url: str) -> ShashankHRAdapter:
+def create_hr_brain_for_shashank(shashank_platform_url: str, pretty: bool = False) -> ShashankHRAdapter:
     """Create ACTIVE RL HR Intelligence Brain for Shashank's platform"""
     print("🚀 Initializing ACTIVE RL HR Intelligence Brain...")
     
     # Initialize with enhanced configuration
-    hr_brain = HRIntelligenceBrain()
+    hr_brain = HRIntelligenceBrain(pretty=pretty)
     
     # Verify RL is active
     print(f"🧠 RL Brain Status: ACTIVE ({len(hr_brain.weights)} skills loaded)")
@@ -541,7 +997,7 @@ if __name__ == "__main__":
     print("="*50)
     
     # Initialize HR Brain for Shashank's platform
-    adapter = create_hr_brain_for_shashank("https://shashank-hr-platform.com/api")
+    adapter = create_hr_brain_for_shashank("https://shashank-hr-platform.com/api", pretty="--pretty" in sys.argv[1:])
     
     # Test connection
     if adapter.connect_to_shashank_platform():
@@ -604,13 +1060,18 @@ if __name__ == "__main__":
         print("\n🎯 RL LEARNING SUMMARY")
         print("-" * 30)
         brain = adapter.hr_brain
-        top_weights = sorted(brain.weights.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_weights = heapq.nlargest(5, brain.weights.items(), key=operator.itemgetter(1))
         
         print(f"📈 Total Skills Learned: {len(brain.weights)}")
         print("🏆 Top Weighted Skills:")
         for skill, weight in top_weights:
             print(f"   • {skill}: {weight:.3f}")
         
+        # Re-score every demo candidate in one vectorized pass
+        print("📊 Final Predictions:")
+        for candidate, prob in zip(test_candidates, brain.predict_success_batch(test_candidates)):
+            print(f"   • {candidate['full_name']}: {prob:.3f}")
+        
         print(f"\n⚙️ Learning Rate: {brain.learning_rate}")
         print("🔄 RL Status: FULLY ACTIVE & LEARNING")
         
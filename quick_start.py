@@ -1,7 +1,20 @@
+import socket
 import subprocess
 import sys
+import threading
 import time
 
+def wait_for_port(port, process, timeout=10.0):
+    """Return once something accepts connections on port, the process dies, or timeout passes"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and process.poll() is None:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
 print("Starting HR AI System...")
 print("=" * 60)
 
@@ -11,7 +24,7 @@ fastapi_process = subprocess.Popen(
     cwd=r"c:\Users\A\Downloads\AI_HR_System-main (1)\AI_HR_System-main"
 )
 
-time.sleep(2)
+wait_for_port(5000, fastapi_process)
 
 # Start Streamlit
 streamlit_process = subprocess.Popen(
@@ -23,10 +36,18 @@ print("\nFastAPI Backend: http://localhost:5000/docs")
 print("Streamlit Dashboard: http://localhost:8501")
 print("\nPress Ctrl+C to stop both services")
 
+# Wake up as soon as either service exits, not only after FastAPI does
+exited = threading.Event()
+for process in (fastapi_process, streamlit_process):
+    threading.Thread(target=lambda p=process: (p.wait(), exited.set()), daemon=True).start()
+
 try:
-    fastapi_process.wait()
-    streamlit_process.wait()
+    while not exited.wait(0.5):  # timed wait keeps Ctrl+C responsive on Windows
+        pass
+    print("\nA service exited; stopping the other")
 except KeyboardInterrupt:
-    fastapi_process.terminate()
-    streamlit_process.terminate()
-    print("\nServices stopped")
+    pass
+
+fastapi_process.terminate()
+streamlit_process.terminate()
+print("\nServices stopped")
@@ -3,17 +3,19 @@ echo Running HR-AI System Tests...
 echo.
 
 echo [1/3] Unit Tests
-python test_runner.py
+python -m pytest -n auto --dist=loadfile -m "not integration" tests/
 if %errorlevel% neq 0 goto :error
 
 echo.
 echo [2/3] Integration Tests  
+python -m pytest -n 4 -m integration tests/
+if %errorlevel% neq 0 goto :error
 python run_tests.py
 if %errorlevel% neq 0 goto :error
 
 echo.
 echo [3/3] Quick Validation
-python quick_test.py
+python -m pytest -n auto tests/test_quick.py
 if %errorlevel% neq 0 goto :error
 
 echo.
@@ -4,14 +4,18 @@ Enhanced HR-AI System Startup Script
 Handles database initialization, security setup, performance monitoring, and automated backups
 """
 
+import importlib.util
 import os
+import signal
 import sys
 import time
 import logging
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from functools import cached_property
 
 # Setup logging
 logging.basicConfig(
@@ -20,6 +24,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bump to re-run the legacy JSON migration on next startup
+CURRENT_SCHEMA_VERSION = "1"
+
 class EnhancedSystemManager:
     """Manages the enhanced HR-AI system startup and monitoring"""
     
@@ -27,7 +34,35 @@ class EnhancedSystemManager:
         self.base_dir = Path(__file__).parent
         self.processes = {}
         self.monitoring_active = False
+        # Child output goes to unbuffered per-service log files, opened on first spawn
+        self._service_logs = {}
         
+    # Third-party packages and app services are imported on first use (after the dependency check)
+    # and kept on the instance
+    @cached_property
+    def http(self):
+        """Shared keep-alive pool for health checks"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        session.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        return session
+    
+    @cached_property
+    def _db(self):
+        from app.utils.database import db_manager
+        return db_manager
+    
+    @cached_property
+    def _pm(self):
+        from app.utils.performance_monitor import performance_monitor
+        return performance_monitor
+    
+    @cached_property
+    def _backups(self):
+        from app.utils.backup_manager import backup_manager
+        return backup_manager
+    
     def check_dependencies(self):
         """Check if all required dependencies are installed"""
         logger.info("Checking system dependencies...")
@@ -40,18 +75,22 @@ class EnhancedSystemManager:
         
         missing_packages = []
         
+        # Locate modules without importing them; pip names that differ from the module name
+        module_names = {'python-dotenv': 'dotenv', 'PyJWT': 'jwt'}
+        
         for package in required_packages:
-            try:
-                __import__(package.replace('-', '_'))
-            except ImportError:
+            module = module_names.get(package, package.replace('-', '_'))
+            if importlib.util.find_spec(module) is None:
                 missing_packages.append(package)
         
         if missing_packages:
             logger.error(f"Missing packages: {missing_packages}")
             logger.info("Installing missing packages...")
             try:
+                # One batched install; wheels only where available, no interactive or version-check overhead
                 subprocess.check_call([
-                    sys.executable, '-m', 'pip', 'install'
+                    sys.executable, '-m', 'pip', 'install',
+                    '--prefer-binary', '--disable-pip-version-check', '--no-input'
                 ] + missing_packages)
                 logger.info("Dependencies installed successfully")
             except subprocess.CalledProcessError as e:
@@ -69,17 +108,17 @@ class EnhancedSystemManager:
             'data', 'feedback', 'logs', 'backups', 'exports', 'uploads'
         ]
         
-        for directory in directories:
-            dir_path = self.base_dir / directory
-            dir_path.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Directory ready: {directory}")
+        # Overlap the mkdir calls (each can be a round-trip on network mounts), then log once
+        with ThreadPoolExecutor(max_workers=len(directories)) as executor:
+            list(executor.map(lambda d: (self.base_dir / d).mkdir(parents=True, exist_ok=True), directories))
+        logger.info(f"Directories ready: {', '.join(directories)}")
     
     def initialize_database(self):
         """Initialize the database system"""
         logger.info("Initializing database system...")
         
         try:
-            from app.utils.database import db_manager
+            db_manager = self._db
             db_manager.init_database()
             
             # Create default admin user if not exists
@@ -105,15 +144,51 @@ class EnhancedSystemManager:
         """Migrate existing JSON data to database"""
         logger.info("Checking for legacy data migration...")
         
+        # One-time step: skip once data/.migrated records the current schema version
+        sentinel = self.base_dir / "data" / ".migrated"
+        if sentinel.exists() and sentinel.read_text().strip() == CURRENT_SCHEMA_VERSION:
+            logger.info("Legacy data already migrated")
+            return True
+        
         try:
             from app.utils.database import DatabaseMigration
             DatabaseMigration.migrate_from_json()
+            sentinel.write_text(CURRENT_SCHEMA_VERSION)
             logger.info("Legacy data migration completed")
             return True
         except Exception as e:
             logger.warning(f"Legacy data migration failed (this is normal for new installations): {e}")
             return True  # Not critical for new installations
     
+    def _spawn(self, name, cmd):
+        """Start a service in its own session with output sent to logs/<name>.log"""
+        if name not in self._service_logs:
+            (self.base_dir / "logs").mkdir(parents=True, exist_ok=True)
+            self._service_logs[name] = open(self.base_dir / "logs" / f"{name}.log", "ab", buffering=0)
+        return subprocess.Popen(
+            cmd,
+            cwd=str(self.base_dir),
+            env=os.environ.copy(),
+            stdout=self._service_logs[name],
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+            close_fds=True
+        )
+    
+    def _wait_for(self, url, process=None, timeout=10, interval=0.1):
+        """Poll url until it returns 200, process exits or timeout passes; logs how long it took"""
+        import requests
+        start = time.monotonic()
+        while time.monotonic() - start < timeout and (process is None or process.poll() is None):
+            try:
+                if self.http.get(url, timeout=0.5).status_code == 200:
+                    logger.info(f"{url} ready after {time.monotonic() - start:.2f}s")
+                    return True
+            except requests.RequestException:
+                pass
+            time.sleep(interval)
+        return False
+    
     def start_fastapi_server(self):
         """Start the FastAPI backend server"""
         logger.info("Starting FastAPI backend server...")
@@ -121,27 +196,15 @@ class EnhancedSystemManager:
         try:
             # Start Uvicorn in a subprocess
             cmd = [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "0.0.0.0", "--port", "5000"]
-            process = subprocess.Popen(
-                cmd,
-                cwd=str(self.base_dir),
-                env=os.environ.copy()
-            )
-            
-            # Wait a moment for server to start
-            time.sleep(3)
+            process = self._spawn('fastapi', cmd)
             
-            # Test server health
-            import requests
-            try:
-                response = requests.get("http://localhost:5000/health", timeout=5)
-                if response.status_code == 200:
-                    logger.info("FastAPI server started successfully on http://localhost:5000")
-                    self.processes['fastapi'] = process
-                    return True
-            except:
+            # Poll health until the server answers instead of sleeping a fixed time
+            self.processes['fastapi'] = process
+            if self._wait_for("http://localhost:5000/health", process):
+                logger.info("FastAPI server started successfully on http://localhost:5000")
+            else:
                 logger.warning("FastAPI health check failed initially (will retry in monitor)")
-                self.processes['fastapi'] = process
-                return True
+            return True
                 
         except Exception as e:
             logger.error(f"Failed to start FastAPI server: {e}")
@@ -154,14 +217,11 @@ class EnhancedSystemManager:
         try:
             # Start Streamlit in a subprocess
             cmd = [sys.executable, "-m", "streamlit", "run", "dashboard/app.py", "--server.port=8501", "--server.headless=true"]
-            process = subprocess.Popen(
-                cmd,
-                cwd=str(self.base_dir),
-                env=os.environ.copy()
-            )
+            process = self._spawn('streamlit', cmd)
             
             # Wait for dashboard to start
-            time.sleep(3)
+            if not self._wait_for("http://localhost:8501", process):
+                logger.warning("Streamlit dashboard not answering yet")
             
             logger.info("Streamlit dashboard process started")
             self.processes['streamlit'] = process
@@ -176,14 +236,11 @@ class EnhancedSystemManager:
         logger.info("Starting monitoring and backup services...")
         
         try:
-            from app.utils.performance_monitor import performance_monitor
-            from app.utils.backup_manager import backup_manager
-            
             # Start performance monitoring
-            performance_monitor.start_monitoring(interval_seconds=30)
+            self._pm.start_monitoring(interval_seconds=30)
             
             # Start automated backups (every 24 hours)
-            backup_manager.start_auto_backup(interval_hours=24)
+            self._backups.start_auto_backup(interval_hours=24)
             
             logger.info("Monitoring and backup services started")
             return True
@@ -201,22 +258,19 @@ class EnhancedSystemManager:
         
         try:
             # Test 1: Database connectivity
-            from app.utils.database import db_manager
-            stats = db_manager.get_database_stats()
+            stats = self._db.get_database_stats()
             if isinstance(stats, dict):
                 tests_passed += 1
                 logger.info("✓ Database connectivity test passed")
             
             # Test 2: API health check
-            import requests
-            response = requests.get("http://localhost:5000/health", timeout=5)
+            response = self.http.get("http://localhost:5000/health", timeout=5)
             if response.status_code == 200:
                 tests_passed += 1
                 logger.info("✓ API health check passed")
             
             # Test 3: Performance monitoring
-            from app.utils.performance_monitor import performance_monitor
-            metrics = performance_monitor.get_current_metrics()
+            metrics = self._pm.get_current_metrics()
             if metrics.get("timestamp"):
                 tests_passed += 1
                 logger.info("✓ Performance monitoring test passed")
@@ -229,8 +283,7 @@ class EnhancedSystemManager:
             logger.info("✓ File system permissions test passed")
             
             # Test 5: Backup system
-            from app.utils.backup_manager import backup_manager
-            backup_list = backup_manager.get_backup_list()
+            backup_list = self._backups.get_backup_list()
             if isinstance(backup_list, list):
                 tests_passed += 1
                 logger.info("✓ Backup system test passed")
@@ -317,25 +370,41 @@ class EnhancedSystemManager:
     
     def monitor_system(self):
         """Monitor system health and restart services if needed"""
+        import psutil
         self.monitoring_active = True
         
+        # Liveness comes from the child process itself; /health is only hit every few minutes
+        deep_check_interval = 300
+        last_deep_check = time.monotonic()
+        server_proc = None
+        psutil.cpu_percent(None)  # prime the non-blocking CPU sampler
+        
         while self.monitoring_active:
             try:
-                # Check FastAPI health
-                import requests
-                response = requests.get("http://localhost:5000/health", timeout=5)
-                if response.status_code != 200:
-                    logger.warning("FastAPI health check failed, attempting restart...")
+                process = self.processes.get('fastapi')
+                if process is None or process.poll() is not None:
+                    logger.warning("FastAPI process exited, attempting restart...")
                     self.start_fastapi_server()
+                    server_proc = None
+                elif time.monotonic() - last_deep_check >= deep_check_interval:
+                    last_deep_check = time.monotonic()
+                    response = self.http.get("http://localhost:5000/health", timeout=5)
+                    if response.status_code != 200:
+                        logger.warning("FastAPI health check failed, attempting restart...")
+                        self.start_fastapi_server()
+                        server_proc = None
                 
                 # Check system resources
-                from app.utils.performance_monitor import performance_monitor
-                metrics = performance_monitor.get_current_metrics()
+                process = self.processes.get('fastapi')
+                if process is not None and process.poll() is None and (server_proc is None or server_proc.pid != process.pid):
+                    server_proc = psutil.Process(process.pid)
+                if server_proc is not None and server_proc.is_running():
+                    logger.debug(f"FastAPI RSS: {server_proc.memory_info().rss / 2**20:.1f} MB")
                 
-                if metrics.get("current", {}).get("memory_percent", 0) > 90:
+                if psutil.virtual_memory().percent > 90:
                     logger.warning("High memory usage detected")
                 
-                if metrics.get("current", {}).get("cpu_percent", 0) > 90:
+                if psutil.cpu_percent(None) > 90:
                     logger.warning("High CPU usage detected")
                 
             except Exception as e:
@@ -351,15 +420,27 @@ class EnhancedSystemManager:
         
         # Stop monitoring services
         try:
-            from app.utils.performance_monitor import performance_monitor
-            from app.utils.backup_manager import backup_manager
-            
-            performance_monitor.stop_monitoring()
-            backup_manager.stop_auto_backup()
+            self._pm.stop_monitoring()
+            self._backups.stop_auto_backup()
             
         except Exception as e:
             logger.error(f"Error stopping monitoring services: {e}")
         
+        # Each service runs in its own session, so signal the whole process group
+        for name, process in self.processes.items():
+            if process.poll() is not None:
+                continue
+            try:
+                if hasattr(os, "killpg"):
+                    os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+                else:
+                    process.terminate()
+            except OSError as e:
+                logger.error(f"Error stopping {name}: {e}")
+        
+        for log_file in self._service_logs.values():
+            log_file.close()
+        
         logger.info("System stopped successfully")
 
 def main():
@@ -375,9 +456,14 @@ def main():
             )
             monitor_thread.start()
             
-            # Keep the main thread alive
-            while True:
-                time.sleep(1)
+            # Block until SIGTERM or Ctrl+C; an untimed wait is not interruptible on Windows
+            stop_event = threading.Event()
+            signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+            while not stop_event.wait(None if os.name == 'posix' else 1):
+                pass
+            logger.info("Shutdown signal received")
+            system_manager.stop_system()
+            sys.exit(0)
         else:
             logger.error("System startup failed")
             sys.exit(1)
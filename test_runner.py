@@ -2,31 +2,77 @@
 import unittest
 import sys
 import os
+import glob
+from functools import lru_cache
 from datetime import datetime
+from multiprocessing import Pool
+
+# "module" runs each test file in its own worker; "class" splits further per TestCase
+PARALLEL_LEVEL = os.environ.get("TEST_PARALLEL_LEVEL", "module")
+
+@lru_cache(maxsize=1)
+def _discover(path='tests', pattern='test_*.py', mtime=None):
+    """Build the suite once per process; mtime busts the cache when a test file changes"""
+    return unittest.TestLoader().discover(path, pattern=pattern, top_level_dir='.')
+
+def _tests_mtime(path='tests', pattern='test_*.py'):
+    """Newest modification time among the test files"""
+    return max((os.stat(f).st_mtime for f in glob.glob(os.path.join(path, pattern))), default=0.0)
+
+def _collect_names(suite, level):
+    """Flatten a discovered suite into dotted module or class names"""
+    names = []
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            names.extend(n for n in _collect_names(test, level) if n not in names)
+        else:
+            name = type(test).__module__
+            if level == "class":
+                name += "." + type(test).__qualname__
+            if name not in names:
+                names.append(name)
+    return names
+
+def _run_name(name):
+    """Run one module/class in a worker and hand back picklable counts"""
+    suite = unittest.TestLoader().loadTestsFromName(name)
+    result = unittest.TextTestRunner(verbosity=1, stream=sys.stdout).run(suite)
+    return (
+        result.testsRun,
+        [(str(t), tb) for t, tb in result.failures],
+        [(str(t), tb) for t, tb in result.errors],
+    )
 
 def run_tests():
     """Run all tests with minimal output"""
     
-    # Discover and run tests
-    loader = unittest.TestLoader()
-    suite = loader.discover('tests', pattern='test_*.py')
+    # Discover tests (cached across reruns), then fan modules out across worker processes
+    suite = _discover(mtime=_tests_mtime())
+    names = _collect_names(suite, PARALLEL_LEVEL)
+    workers = max(1, min(len(names), (os.cpu_count() or 1) - 2))
     
     print("🧪 Running Test Suite:")
     print("   - test_rl_brain.py (RL functionality)")
     print("   - test_api.py (API endpoints)")
     print("   - test_rl_robustness.py (RL stress tests)")
+    print(f"   ({len(names)} {PARALLEL_LEVEL}s across {workers} workers)")
     print()
     
-    # Run with minimal verbosity
-    runner = unittest.TextTestRunner(verbosity=1, stream=sys.stdout)
-    result = runner.run(suite)
+    with Pool(workers) as pool:
+        outcomes = pool.map(_run_name, names)
     
-    # Print summary
-    total = result.testsRun
-    failures = len(result.failures)
-    errors = len(result.errors)
+    # Merge worker results
+    total = sum(o[0] for o in outcomes)
+    failure_list = [f for o in outcomes for f in o[1]]
+    error_list = [e for o in outcomes for e in o[2]]
+    failures = len(failure_list)
+    errors = len(error_list)
     passed = total - failures - errors
     
+    for label, items in (("FAIL", failure_list), ("ERROR", error_list)):
+        for test, tb in items:
+            print(f"\n{label}: {test}\n{tb}")
+    
     print(f"\n{'='*40}")
     print(f"TEST SUMMARY")
     print(f"{'='*40}")
@@ -35,8 +81,8 @@ def run_tests():
     print(f"🔥 Errors: {errors}")
     print(f"📊 Success: {(passed/total)*100:.1f}%" if total > 0 else "No tests")
     
-    return result.wasSuccessful()
+    return failures == 0 and errors == 0
 
 if __name__ == '__main__':
     success = run_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
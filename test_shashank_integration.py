@@ -5,192 +5,257 @@ Tests 5 end-to-end flows as required
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import functools
 import json
+import os
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from types import MappingProxyType
+
+# Per-flow candidates, built once and read-only; flows take a dict() copy to send
+_CAND_SHASHANK = MappingProxyType({
+    "name": "Shashank Test User",
+    "email": "shashank@test.com", 
+    "phone": "+91-9876543210",
+    "skills": ["Java", "Spring Boot", "Microservices"]
+})
+_CAND_FEEDBACK = MappingProxyType({
+    "name": "Feedback Test",
+    "skills": ["Python", "AI", "FastAPI"]
+})
+_CAND_DECISION_CHANGE = MappingProxyType({
+    "name": "Decision Change Test",
+    "skills": ["ReactJS", "NodeJS", "MongoDB"]
+})
+
+def _flow_safe(name):
+    """Log an unexpected exception from a flow as a failure of that flow instead of raising"""
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrap(self, *args, **kwargs):
+            try:
+                return fn(self, *args, **kwargs)
+            except Exception as e:
+                self.log_test(name, False, str(e))
+                return False
+        return wrap
+    return deco
 
 class ShashankIntegrationTester:
+    # (connect, read) seconds: a hung server fails the flow instead of stalling the suite
+    DEFAULT_TIMEOUT = (2, 5)
+    
     def __init__(self, base_url="http://localhost:5000"):
         self.base_url = base_url
         self.test_results = []
+        self._results_lock = threading.Lock()  # flows run concurrently
+        # Result lines are collected and written once per run; CI_VERBOSE prints them as they happen
+        self._verbose = bool(os.environ.get("CI_VERBOSE"))
+        self._log_buffer = []
+        # Keep-alive pool shared by every flow
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+        self._json_headers = {"Content-Type": "application/json"}
+    
+    def _decide(self, candidate_data):
+        """POST /ai/decide; None on HTTP error"""
+        body = json.dumps({"candidate_data": candidate_data}).encode()
+        response = self.session.post(f"{self.base_url}/ai/decide", data=body, headers=self._json_headers, timeout=self.DEFAULT_TIMEOUT)
+        if response.status_code != 200:
+            return None
+        return response.json()
+    
+    def _feedback(self, path, payload):
+        """POST feedback to the RL brain"""
+        return self.session.post(f"{self.base_url}{path}", data=json.dumps(payload).encode(), headers=self._json_headers, timeout=self.DEFAULT_TIMEOUT)
+    
+    def _wait_ready(self, timeout=30):
+        """Poll /health with exponential backoff until it answers 200; False on timeout"""
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        while time.monotonic() < deadline:
+            try:
+                if self.session.get(f"{self.base_url}/health", timeout=1).status_code == 200:
+                    return True
+            except requests.RequestException:
+                pass
+            time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+            delay = min(delay * 2, 2.0)
+        return False
     
     def log_test(self, test_name, passed, details=""):
         status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status} {test_name} - {details}")
-        self.test_results.append({"test": test_name, "passed": passed, "details": details})
+        line = f"{status} {test_name} - {details}\n"
+        with self._results_lock:
+            if self._verbose:
+                sys.stdout.write(line)
+            else:
+                self._log_buffer.append(line)
+            self.test_results.append({"test": test_name, "passed": passed, "details": details})
+    
+    def flush_log(self):
+        """Write buffered result lines in one go"""
+        with self._results_lock:
+            lines, self._log_buffer = self._log_buffer, []
+        if lines:
+            sys.stdout.write("\n" + "".join(lines))
+            sys.stdout.flush()
     
+    @_flow_safe("Flow 1")
     def test_flow_1_candidate_to_ai_decision(self):
         """Flow 1: Candidate → Shashank → AI Decide → Store"""
         print("\n🔄 Flow 1: Candidate Processing")
         
         # Add candidate
-        candidate_data = {
-            "name": "Shashank Test User",
-            "email": "shashank@test.com", 
-            "phone": "+91-9876543210",
-            "skills": ["Java", "Spring Boot", "Microservices"]
-        }
+        candidate_data = dict(_CAND_SHASHANK)
         
-        try:
-            # Step 1: Add candidate
-            response = requests.post(f"{self.base_url}/candidate/add", json=candidate_data)
-            if response.status_code == 200:
-                candidate_id = response.json().get("candidate_id")
-                self.log_test("Candidate Addition", True, f"ID: {candidate_id}")
-                
-                # Step 2: AI Decision
-                decision_request = {"candidate_data": candidate_data}
-                decision_response = requests.post(f"{self.base_url}/ai/decide", json=decision_request)
-                
-                if decision_response.status_code == 200:
-                    decision = decision_response.json()
-                    self.log_test("AI Decision", True, f"Decision: {decision.get('decision')}")
-                    return True
-                else:
-                    self.log_test("AI Decision", False, "Decision API failed")
+        # Step 1: Add candidate
+        response = self.session.post(f"{self.base_url}/candidate/add", json=candidate_data, timeout=self.DEFAULT_TIMEOUT)
+        if response.status_code == 200:
+            candidate_id = response.json().get("candidate_id")
+            self.log_test("Candidate Addition", True, f"ID: {candidate_id}")
+            
+            # Step 2: AI Decision
+            decision = self._decide(candidate_data)
+            
+            if decision is not None:
+                self.log_test("AI Decision", True, f"Decision: {decision.get('decision')}")
+                return True
             else:
-                self.log_test("Candidate Addition", False, "Add candidate failed")
-        except Exception as e:
-            self.log_test("Flow 1", False, str(e))
+                self.log_test("AI Decision", False, "Decision API failed")
+        else:
+            self.log_test("Candidate Addition", False, "Add candidate failed")
         
         return False
     
+    @_flow_safe("Flow 2")
     def test_flow_2_feedback_loop(self):
         """Flow 2: HR Feedback → AI Feedback Loop"""
         print("\n🔄 Flow 2: Feedback Loop")
         
-        candidate_data = {
-            "name": "Feedback Test",
-            "skills": ["Python", "AI", "FastAPI"]
+        candidate_data = dict(_CAND_FEEDBACK)
+        
+        # Get initial prediction
+        initial_prob = (self._decide(candidate_data) or {}).get("success_probability", 0)
+        
+        # Submit feedback
+        feedback_data = {
+            "candidate_data": candidate_data,
+            "feedback_score": 5.0,
+            "outcome": "hired"
         }
         
-        try:
-            # Get initial prediction
-            decision_response = requests.post(f"{self.base_url}/ai/decide", 
-                                            json={"candidate_data": candidate_data})
-            initial_prob = decision_response.json().get("success_probability", 0)
-            
-            # Submit feedback
-            feedback_data = {
-                "candidate_data": candidate_data,
-                "feedback_score": 5.0,
-                "outcome": "hired"
-            }
+        feedback_response = self._feedback("/ai/feedback", feedback_data)
+        
+        if feedback_response.status_code == 200:
+            self.log_test("Feedback Processing", True, "Feedback accepted")
             
-            feedback_response = requests.post(f"{self.base_url}/ai/feedback", json=feedback_data)
+            # Verify learning: the feedback response already carries the re-scored probability;
+            # only servers that don't report it need a second decide
+            new_prob = feedback_response.json().get("learning_metrics", {}).get("prediction_after")
+            if new_prob is None:
+                new_prob = (self._decide(candidate_data) or {}).get("success_probability", 0)
             
-            if feedback_response.status_code == 200:
-                self.log_test("Feedback Processing", True, "Feedback accepted")
-                
-                # Verify learning
-                new_decision = requests.post(f"{self.base_url}/ai/decide", 
-                                           json={"candidate_data": candidate_data})
-                new_prob = new_decision.json().get("success_probability", 0)
-                
-                learning_occurred = abs(new_prob - initial_prob) > 0.001
-                self.log_test("RL Learning", learning_occurred, 
-                            f"Prob: {initial_prob:.3f} → {new_prob:.3f}")
-                return True
-            else:
-                self.log_test("Feedback Processing", False, "Feedback API failed")
-        except Exception as e:
-            self.log_test("Flow 2", False, str(e))
+            learning_occurred = abs(new_prob - initial_prob) > 0.001
+            self.log_test("RL Learning", learning_occurred, 
+                        f"Prob: {initial_prob:.3f} → {new_prob:.3f}")
+            return True
+        else:
+            self.log_test("Feedback Processing", False, "Feedback API failed")
         
         return False
     
+    @_flow_safe("Flow 3")
     def test_flow_3_decision_change(self):
         """Flow 3: Decision change after feedback"""
         print("\n🔄 Flow 3: Decision Change Verification")
         
-        candidate_data = {
-            "name": "Decision Change Test",
-            "skills": ["ReactJS", "NodeJS", "MongoDB"]
+        candidate_data = dict(_CAND_DECISION_CHANGE)
+        
+        # Multiple feedback cycles to ensure change, sent as one bulk request
+        feedback_data = {
+            "candidate_data": candidate_data,
+            "feedback_score": 4.5,
+            "outcome": "hired"
         }
+        bulk_response = self._feedback("/ai/feedback/bulk", {"items": [feedback_data] * 3})
+        if bulk_response.status_code != 200:
+            self.log_test("Decision Change", False, f"Bulk feedback failed: HTTP {bulk_response.status_code}")
+            return False
         
-        try:
-            # Multiple feedback cycles to ensure change
-            for i in range(3):
-                feedback_data = {
-                    "candidate_data": candidate_data,
-                    "feedback_score": 4.5,
-                    "outcome": "hired"
-                }
-                requests.post(f"{self.base_url}/ai/feedback", json=feedback_data)
-            
-            # Check final decision
-            final_decision = requests.post(f"{self.base_url}/ai/decide", 
-                                         json={"candidate_data": candidate_data})
+        # Check final decision
+        decision_data = self._decide(candidate_data)
+        
+        if decision_data is not None:
+            prob = decision_data.get("success_probability", 0)
+            decision = decision_data.get("decision", "")
             
-            if final_decision.status_code == 200:
-                decision_data = final_decision.json()
-                prob = decision_data.get("success_probability", 0)
-                decision = decision_data.get("decision", "")
-                
-                # Verify positive decision after positive feedback
-                positive_decision = prob > 0.5 or "recommend" in decision.lower()
-                self.log_test("Decision Change", positive_decision, 
-                            f"Final decision: {decision} (prob: {prob:.3f})")
-                return positive_decision
-            else:
-                self.log_test("Decision Change", False, "Decision API failed")
-        except Exception as e:
-            self.log_test("Flow 3", False, str(e))
+            # Verify positive decision after positive feedback
+            positive_decision = prob > 0.5 or "recommend" in decision.lower()
+            self.log_test("Decision Change", positive_decision, 
+                        f"Final decision: {decision} (prob: {prob:.3f})")
+            return positive_decision
+        else:
+            self.log_test("Decision Change", False, "Decision API failed")
         
         return False
     
+    @_flow_safe("Flow 4")
     def test_flow_4_automation_trigger(self):
         """Flow 4: Automation trigger confirmation"""
         print("\n🔄 Flow 4: Automation Trigger")
         
-        try:
-            # Trigger automation event
-            automation_data = {
-                "candidate_id": 1,
-                "event_type": "shortlisted",
-                "metadata": {"test": "shashank_integration"}
-            }
-            
-            response = requests.post(f"{self.base_url}/trigger/", json=automation_data)
-            
-            if response.status_code == 200:
-                result = response.json()
-                success = result.get("status") == "success"
-                self.log_test("Automation Trigger", success, 
-                            f"Event: {automation_data['event_type']}")
-                return success
-            else:
-                self.log_test("Automation Trigger", False, f"HTTP {response.status_code}")
-        except Exception as e:
-            self.log_test("Flow 4", False, str(e))
+        # Trigger automation event
+        automation_data = {
+            "candidate_id": 1,
+            "event_type": "shortlisted",
+            "metadata": {"test": "shashank_integration"}
+        }
+        
+        response = self.session.post(f"{self.base_url}/trigger/", json=automation_data, timeout=self.DEFAULT_TIMEOUT)
+        
+        if response.status_code == 200:
+            result = response.json()
+            success = result.get("status") == "success"
+            self.log_test("Automation Trigger", success, 
+                        f"Event: {automation_data['event_type']}")
+            return success
+        else:
+            self.log_test("Automation Trigger", False, f"HTTP {response.status_code}")
         
         return False
     
+    @_flow_safe("Flow 5")
     def test_flow_5_logs_verification(self):
         """Flow 5: Logs verification with Tiwari"""
         print("\n🔄 Flow 5: Logs Verification")
         
-        try:
-            # Check RL history logs
-            history_response = requests.get(f"{self.base_url}/ai/rl-history?limit=5")
+        # History and status are independent reads: issue both at once on the pooled session
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            status_future = executor.submit(self.session.get, f"{self.base_url}/ai/status", timeout=self.DEFAULT_TIMEOUT)
+            history_response = self.session.get(f"{self.base_url}/ai/rl-history?limit=5", timeout=self.DEFAULT_TIMEOUT)
+            status_response = status_future.result()
+        
+        # Check RL history logs
+        if history_response.status_code == 200:
+            history = history_response.json().get("history", [])
+            has_logs = len(history) > 0
+            self.log_test("RL History Logs", has_logs, f"{len(history)} entries found")
             
-            if history_response.status_code == 200:
-                history = history_response.json().get("history", [])
-                has_logs = len(history) > 0
-                self.log_test("RL History Logs", has_logs, f"{len(history)} entries found")
-                
-                # Check system status
-                status_response = requests.get(f"{self.base_url}/ai/status")
-                if status_response.status_code == 200:
-                    status = status_response.json()
-                    rl_active = status.get("rl_status") == "ACTIVE"
-                    self.log_test("System Status", rl_active, "RL Brain active")
-                    return has_logs and rl_active
-                else:
-                    self.log_test("System Status", False, "Status API failed")
+            # Check system status
+            if status_response.status_code == 200:
+                status = status_response.json()
+                rl_active = status.get("rl_status") == "ACTIVE"
+                self.log_test("System Status", rl_active, "RL Brain active")
+                return has_logs and rl_active
             else:
-                self.log_test("RL History Logs", False, "History API failed")
-        except Exception as e:
-            self.log_test("Flow 5", False, str(e))
+                self.log_test("System Status", False, "Status API failed")
+        else:
+            self.log_test("RL History Logs", False, "History API failed")
         
         return False
     
@@ -199,20 +264,31 @@ class ShashankIntegrationTester:
         print("🚀 Shashank Platform Integration Test Suite")
         print("=" * 50)
         
-        flows = [
+        # Flows 1 and 4 hit disjoint endpoints. 2 and 3 both train the RL brain, and 5 checks the
+        # history they write, so those three run in order
+        independent = [
             ("Flow 1: Candidate → AI Decision → Store", self.test_flow_1_candidate_to_ai_decision),
+            ("Flow 4: Automation Trigger", self.test_flow_4_automation_trigger)
+        ]
+        learning = [
             ("Flow 2: HR Feedback → AI Loop", self.test_flow_2_feedback_loop),
             ("Flow 3: Decision Change After Feedback", self.test_flow_3_decision_change),
-            ("Flow 4: Automation Trigger", self.test_flow_4_automation_trigger),
             ("Flow 5: Logs Verification", self.test_flow_5_logs_verification)
         ]
         
-        passed_flows = 0
+        def run_flows(flows):
+            results = []
+            for flow_name, flow_test in flows:
+                with self._results_lock:
+                    print(f"\n📋 Testing: {flow_name}")
+                results.append(flow_test())
+            return results
         
-        for flow_name, flow_test in flows:
-            print(f"\n📋 Testing: {flow_name}")
-            if flow_test():
-                passed_flows += 1
+        with ThreadPoolExecutor(max_workers=len(independent) + 1) as executor:
+            futures = [executor.submit(run_flows, [flow]) for flow in independent]
+            futures.append(executor.submit(run_flows, learning))
+            passed_flows = sum(sum(future.result()) for future in futures)
+        self.flush_log()
         
         # Summary
         print("\n" + "=" * 50)
@@ -235,9 +311,13 @@ def main():
     print("Starting Shashank Platform Integration Tests...")
     print("Make sure the HR-AI system is running on localhost:5000")
     
-    input("Press Enter when system is ready...")
-    
     tester = ShashankIntegrationTester()
+    if "--interactive" in sys.argv[1:]:
+        input("Press Enter when system is ready...")
+    elif not tester._wait_ready():
+        print("System not ready: /health did not answer on localhost:5000")
+        sys.exit(2)
+    
     success = tester.run_all_flows()
     
     if success:
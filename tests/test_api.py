@@ -1,18 +1,32 @@
 import unittest
+import pytest
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
+@pytest.mark.integration
 class TestAPI(unittest.TestCase):
     BASE_URL = "http://localhost:5000"
+    DEFAULT_TIMEOUT = (2, 5)  # (connect, read) seconds
+    
+    @classmethod
+    def setUpClass(cls):
+        # One keep-alive connection pool for the whole class
+        cls.session = requests.Session()
+        cls.session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.close()
     
     def test_health(self):
-        response = requests.get(f"{self.BASE_URL}/health")
+        response = self.session.get(f"{self.BASE_URL}/health", timeout=self.DEFAULT_TIMEOUT)
         self.assertEqual(response.status_code, 200)
         self.assertIn("status", response.json())
     
     def test_ai_decision(self):
         data = {"candidate_data": {"name": "Test", "skills": ["Python"]}}
-        response = requests.post(f"{self.BASE_URL}/ai/decide", json=data)
+        response = self.session.post(f"{self.BASE_URL}/ai/decide", json=data, timeout=self.DEFAULT_TIMEOUT)
         self.assertEqual(response.status_code, 200)
         result = response.json()
         self.assertIn("decision", result)
@@ -24,7 +38,7 @@ class TestAPI(unittest.TestCase):
             "feedback_score": 4.0,
             "outcome": "hired"
         }
-        response = requests.post(f"{self.BASE_URL}/ai/feedback", json=data)
+        response = self.session.post(f"{self.BASE_URL}/ai/feedback", json=data, timeout=self.DEFAULT_TIMEOUT)
         self.assertEqual(response.status_code, 200)
     
     def test_candidate_add(self):
@@ -34,7 +48,7 @@ class TestAPI(unittest.TestCase):
             "phone": "+91-9999999999",
             "skills": ["Testing"]
         }
-        response = requests.post(f"{self.BASE_URL}/candidate/add", json=data)
+        response = self.session.post(f"{self.BASE_URL}/candidate/add", json=data, timeout=self.DEFAULT_TIMEOUT)
         self.assertEqual(response.status_code, 200)
 
 if __name__ == '__main__':
@@ -0,0 +1,105 @@
+"""Quick checks that all fixes are in place; independent, so they can run in parallel (pytest -n auto)"""
+
+import copy
+import functools
+import re
+import unittest
+import sys
+import os
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+@functools.lru_cache(maxsize=4)
+def _read_text(path: str) -> str:
+    """Read a source file once per run"""
+    with open(os.path.join(ROOT, path), "r", encoding="utf-8") as f:
+        return f.read()
+
+def _find_all(content: str, needles: list) -> set:
+    """Which needles occur in content, found in a single regex scan"""
+    pattern = re.compile("|".join(map(re.escape, sorted(needles, key=len, reverse=True))))
+    return set(pattern.findall(content))
+
+@functools.lru_cache(maxsize=1)
+def _get_brain():
+    """One RL brain per test process; weight loading happens once"""
+    from hr_intelligence_brain import HRIntelligenceBrain
+    return HRIntelligenceBrain()
+
+class TestQuick(unittest.TestCase):
+
+    def test_rl_brain(self):
+        """RL brain initializes, predicts and learns from feedback"""
+        brain = _get_brain()
+        self.assertGreater(len(brain.weights), 0)
+
+        test_candidate = {
+            "name": "Test User",
+            "skills": ["Python", "AI", "FastAPI"]
+        }
+
+        # The shared brain must come back unchanged so reruns start from the same weights
+        snapshot = copy.deepcopy(brain.weights)
+        try:
+            initial_prediction = brain.predict_success(test_candidate)
+            brain.reward_log(test_candidate, 4.5, "hired")
+            new_prediction = brain.predict_success(test_candidate)
+        finally:
+            brain.weights = snapshot
+            brain._save_weights()
+
+        for prediction in (initial_prediction, new_prediction):
+            self.assertGreaterEqual(prediction, 0.0)
+            self.assertLessEqual(prediction, 1.0)
+
+    def test_microservice(self):
+        """AI microservice ships its deployment files"""
+        microservice_dir = os.path.join(ROOT, "ai_microservice")
+        self.assertTrue(os.path.isdir(microservice_dir), "AI Microservice directory missing")
+
+        key_files = [
+            "ai_brain_service.py",
+            "Dockerfile",
+            "docker-compose.yml",
+            "install.py",
+            "README.md"
+        ]
+        # One directory listing instead of a stat per file
+        with os.scandir(microservice_dir) as entries:
+            existing = {e.name for e in entries}
+        missing = [f for f in key_files if f not in existing]
+        self.assertEqual(missing, [])
+
+    def test_dashboard_files(self):
+        """Dashboard has the RL Analytics section"""
+        rl_features = [
+            "RL Analytics",
+            "rl-analytics",
+            "rl-state",
+            "rl-history",
+            "Brain State Visualization",
+            "Reward Evolution"
+        ]
+
+        present = _find_all(_read_text("dashboard/app.py"), rl_features)
+        missing = [f for f in rl_features if f not in present]
+        self.assertGreaterEqual(len(present), 4, f"Missing RL features: {', '.join(missing)}")
+
+    def test_integration_files(self):
+        """Integration suite covers the key RL and platform checks"""
+        self.assertTrue(os.path.exists(os.path.join(ROOT, "integration_tests.py")), "Integration test file missing")
+
+        test_methods = [
+            "test_rl_brain_active",
+            "test_rl_decision_making",
+            "test_rl_learning_loop",
+            "test_shashank_integration",
+            "test_dashboard_rl_section"
+        ]
+
+        present = _find_all(_read_text("integration_tests.py"), test_methods)
+        missing = [t for t in test_methods if t not in present]
+        self.assertGreaterEqual(len(present), 4, f"Missing tests: {', '.join(missing)}")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,8 +7,18 @@ from hr_intelligence_brain import HRIntelligenceBrain
 
 class TestRLBrain(unittest.TestCase):
     
+    @classmethod
+    def setUpClass(cls):
+        # One brain per class; each test gets the weights back as they were before it ran
+        cls._brain = HRIntelligenceBrain()
+    
     def setUp(self):
-        self.brain = HRIntelligenceBrain()
+        self.brain = self._brain
+        self._snapshot = dict(self._brain.weights)
+    
+    def tearDown(self):
+        self._brain.weights = self._snapshot  # the setter rebuilds the skill index
+        self._brain._save_weights()
     
     def test_prediction(self):
         candidate = {"name": "Test", "skills": ["Python", "AI"]}
@@ -1,31 +1,65 @@
 import unittest
+import itertools
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from hr_intelligence_brain import HRIntelligenceBrain
 import time
+import numpy as np
+
+_NUMBERED_SKILLS = tuple("Skill" + str(i) for i in range(10))
 
 class TestRLRobustness(unittest.TestCase):
     
+    @classmethod
+    def setUpClass(cls):
+        # One brain per class; each test gets the weights back as they were before it ran
+        cls._brain = HRIntelligenceBrain()
+    
     def setUp(self):
-        self.brain = HRIntelligenceBrain()
+        self.brain = self._brain
+        self._snapshot = dict(self._brain.weights)
+    
+    def tearDown(self):
+        self._brain.weights = self._snapshot  # the setter rebuilds the skill index
+        self._brain._save_weights()
     
     def test_stress_learning(self):
         """Test RL under high feedback load"""
         candidate = {"name": "Stress Test", "skills": ["Python", "AI"]}
         
-        # Rapid feedback cycles
-        for i in range(50):
-            score = 5.0 if i % 2 == 0 else 1.0
-            outcome = "hired" if i % 2 == 0 else "rejected"
-            self.brain.reward_log(candidate, score, outcome)
+        # Rapid feedback cycles, applied as one batch
+        cycles = np.arange(50)
+        scores = np.where(cycles % 2 == 0, 5.0, 1.0)
+        outcomes = ["hired" if i % 2 == 0 else "rejected" for i in cycles]
+        self.brain.reward_log_batch(candidate, scores, outcomes)
         
         # Verify brain still functions
         prob = self.brain.predict_success(candidate)
         self.assertIsInstance(prob, float)
         self.assertGreater(len(self.brain.weights), 0)
     
+    def test_batch_matches_sequential(self):
+        """reward_log_batch ends in the same weights as reward_log per item"""
+        candidate = {"name": "Batch Test", "skills": ["Python", "BatchSkill"]}
+        scores = [5.0, 1.0, 4.0, 2.0, 5.0]
+        outcomes = ["rejected", "rejected", "hired", "maybe", "hired"]
+        
+        sequential = HRIntelligenceBrain()
+        sequential.weights = dict(self.brain.weights)
+        try:
+            for score, outcome in zip(scores, outcomes):
+                sequential.reward_log(candidate, score, outcome)
+            expected = dict(sequential.weights)
+        finally:
+            sequential.weights = dict(self._snapshot)  # its pending save must not outlive tearDown's restore
+        self.brain.reward_log_batch(candidate, scores, outcomes)
+        
+        self.assertEqual(list(self.brain.weights), list(expected))
+        for skill, weight in expected.items():
+            self.assertAlmostEqual(self.brain.weights[skill], weight, places=12)
+    
     def test_skill_discovery_robustness(self):
         """Test new skill learning under various conditions"""
         initial_count = len(self.brain.weights)
@@ -34,12 +68,13 @@ class TestRLRobustness(unittest.TestCase):
         skills_sets = [
             ["NewTech1", "Framework1"],
             ["Language1", "Tool1", "Platform1"],
-            ["Skill" + str(i) for i in range(10)]
+            list(_NUMBERED_SKILLS)
         ]
         
-        for skills in skills_sets:
-            candidate = {"name": "Test", "skills": skills}
-            self.brain.reward_log(candidate, 4.0, "hired")
+        # One reward_log over all sets: a single weights update instead of one per set
+        all_skills = list(itertools.chain.from_iterable(skills_sets))
+        candidate = {"name": "Test", "skills": all_skills}
+        self.brain.reward_log(candidate, 4.0, "hired")
         
         # Verify skill discovery
         self.assertGreater(len(self.brain.weights), initial_count)
@@ -52,10 +87,10 @@ class TestRLRobustness(unittest.TestCase):
         for _ in range(20):
             self.brain.reward_log(candidate, 5.0, "hired")
         
-        # Check weights stay within bounds
-        for weight in self.brain.weights.values():
-            self.assertLessEqual(weight, 5.0)
-            self.assertGreaterEqual(weight, 0.1)
+        # Check weights stay within bounds: one min/max reduction instead of a per-key loop
+        weights = np.fromiter(self.brain.weights.values(), dtype=np.float64, count=len(self.brain.weights))
+        self.assertLessEqual(float(weights.max()), 5.0)
+        self.assertGreaterEqual(float(weights.min()), 0.1)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file